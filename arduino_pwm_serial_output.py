@@ -15,41 +15,72 @@
 
 import serial
 import serial.tools.list_ports
+import functools
+import os
+import re
 import time
 import sys
 import threading
+import queue
 import atexit
 import signal
 import requests
 import socket
+import cv2
 from eye_detection_model import EyeDetectionModel
 
 # Global configuration
 REFERENCE_OFFSET_PIXELS = 210  # Pixels above center for target reference point
 
+def _int_to_ascii3(n):
+    """
+    Render an integer in 0-999 as three ASCII digit bytes.
+
+    Two divmods and a bytes() build - no f-string formatting machinery.
+    Used to fill the pad table below, and usable directly if a magnitude
+    ever needs converting outside the precomputed range.
+
+    Args:
+        n (int): Value in 0-999
+
+    Returns:
+        bytes: Three zero-padded ASCII digits
+    """
+    hundreds, rest = divmod(n, 100)
+    tens, ones = divmod(rest, 10)
+    return bytes((48 + hundreds, 48 + tens, 48 + ones))
+
+
+# Common Arduino port/driver identifiers, compiled once so port scanning
+# is a single C-level regex search per port
+_ARDUINO_PORT_RE = re.compile(r"usbmodem|arduino|ch34[01]|ftdi", re.IGNORECASE)
+
+# Packet-building tables at module scope so the kernel below is a plain
+# function with no per-call attribute lookups
+_PAD3 = tuple(_int_to_ascii3(i) for i in range(1000))
+_IN_ZONE = b"U000L000"  # Eye detected and inside the deadzone
+_NEUTRAL = b"N000N000"  # No eye detected
+_VDIR = (b"U", b"D")  # Indexed by (dy > 0)
+_HDIR = (b"L", b"R")  # Indexed by (dx > 0)
 
+
+@functools.lru_cache(maxsize=1)
 def find_arduino_port():
     """
     Automatically detect Arduino serial port.
 
+    Memoized: enumerating the USB tree via comports() can take 50-100 ms,
+    so the result is cached for the process lifetime. Reconnect paths call
+    cache_clear() first when the cached port stops working.
+
     Returns:
         str: Arduino port path, or None if not found
     """
     ports = serial.tools.list_ports.comports()
 
-    # Look for common Arduino identifiers
+    # Look for common Arduino identifiers in the device name or description
     for port in ports:
-        port_name = port.device.lower()
-        description = (port.description or "").lower()
-
-        # Check for Arduino-like ports
-        if (
-            "usbmodem" in port_name
-            or "arduino" in description
-            or "ch340" in description
-            or "ch341" in description
-            or "ftdi" in description
-        ):
+        if _ARDUINO_PORT_RE.search(f"{port.device} {port.description or ''}"):
             print(
                 f"🔍 Found potential Arduino port: {port.device} ({port.description})"
             )
@@ -86,24 +117,29 @@ class ArduinoPWMSerialOutput:
     Supports both serial and WiFi communication modes.
     """
 
-    def __init__(self, serial_port=None, baud_rate=115200, deadzone_pixels=10, 
-                 arduino_ip="192.168.1.60", arduino_port=8080):
+    def __init__(self, serial_port=None, baud_rate=115200, deadzone_pixels=10,
+                 arduino_ip="192.168.1.60", arduino_port=8080, write_timeout=0.05):
         """
         Initialize Arduino communication (serial and/or WiFi).
 
         Args:
             serial_port (str): Arduino serial port path (None if no Arduino)
-            baud_rate (int): Serial communication baud rate
+            baud_rate (int): Serial communication baud rate (must match the
+                Serial.begin rate in the Arduino sketch)
             deadzone_pixels (int): Deadzone radius in pixels around frame center
             arduino_ip (str): Arduino WiFi IP address
             arduino_port (int): Arduino WiFi server port
+            write_timeout (float): Max seconds a serial write may block before
+                raising, so a stuck USB buffer can't stall the writer thread
         """
         print(f"Initializing eye tracking system...")
         self.serial_port = serial_port
         self.baud_rate = baud_rate
+        self.write_timeout = write_timeout
         self.deadzone_pixels = deadzone_pixels
         self.arduino = None
-        
+        self._arduino_fd = None  # Raw fd for the writer thread's fast path
+
         # WiFi communication setup
         self.arduino_ip = arduino_ip
         self.arduino_port = arduino_port
@@ -113,7 +149,11 @@ class ArduinoPWMSerialOutput:
         if serial_port:
             print(f"Serial port: {serial_port}, baud rate: {baud_rate}")
             try:
-                self.arduino = serial.Serial(serial_port, baud_rate, timeout=1)
+                self.arduino = serial.Serial(
+                    serial_port, baud_rate, timeout=1, write_timeout=write_timeout
+                )
+                self._enable_low_latency(self.arduino)
+                self._arduino_fd = self._port_fd(self.arduino)
                 print("✓ Arduino connection established")
                 time.sleep(2)  # Allow board reset
             except Exception as e:
@@ -149,6 +189,56 @@ class ArduinoPWMSerialOutput:
         self.frame_h = self.eye_model.frame_h
         print(f"✓ Camera resolution: {self.frame_w}x{self.frame_h}")
 
+        # Drop stale frames: limit the driver-side queue so every read is
+        # the newest frame rather than one buffered seconds ago
+        if self.eye_model.set_buffer_size(1):
+            print("✓ Camera frame buffer limited to newest frame")
+
+        # Precompute reference point for the per-frame packet math
+        # (recomputing these at camera FPS is wasted work)
+        self._ref_x = self.frame_w // 2
+        self._ref_y = self.frame_h // 2 - REFERENCE_OFFSET_PIXELS
+        self._deadzone_sq = deadzone_pixels * deadzone_pixels
+
+        # Half-packet tables indexed by raw signed delta (offset by the
+        # frame dimension), so the per-frame build is two table indexes and
+        # one concatenation - direction select, abs, clamp, and digit
+        # formatting all happen once here. ~100 KB for 640x480 frames.
+        self._v_off = self.frame_h
+        self._v_max = 2 * self.frame_h
+        self._v_half = tuple(
+            _VDIR[d > 0] + _PAD3[min(abs(d), 999)]
+            for d in range(-self.frame_h, self.frame_h + 1)
+        )
+        self._h_off = self.frame_w
+        self._h_max = 2 * self.frame_w
+        self._h_half = tuple(
+            _HDIR[d > 0] + _PAD3[min(abs(d), 999)]
+            for d in range(-self.frame_w, self.frame_w + 1)
+        )
+
+        # Background serial writer - the main loop enqueues packets and never
+        # blocks on a USB write; a bounded queue drops packets under backlog
+        self._tx_queue = queue.Queue(maxsize=4)
+        self._tx_thread = threading.Thread(target=self._tx_worker, daemon=True)
+        self._tx_thread.start()
+
+        # Serial link state machine: the fast path is a boolean check plus
+        # the write; reconnects only run after a real failure and are
+        # rate-limited by a cooldown so a dead link can't storm the loop
+        self._link_ok = self.arduino is not None
+        self._reconnect_cooldown_ns = 500_000_000  # 0.5 s between reconnect attempts
+        self._reconnect_at_ns = 0
+
+        # Duplicate-packet suppression: during fixation most frames produce
+        # identical packets, so skip the write unless the packet changed or
+        # the heartbeat deadline passed (keeps the Arduino link fresh).
+        # Deadlines are integer monotonic nanoseconds - integer compares,
+        # no float drift over long sessions
+        self._last_packet = None
+        self._next_heartbeat_ns = 0
+        self._heartbeat_interval_ns = 100_000_000  # 100 ms between forced resends
+
         # Cleanup tracking
         self._cleanup_called = False
         self._cleanup_lock = threading.Lock()
@@ -160,6 +250,22 @@ class ArduinoPWMSerialOutput:
 
         print("Eye tracking system ready!")
 
+    @staticmethod
+    def _port_fd(port):
+        """Return the port's raw file descriptor, or None if unavailable."""
+        try:
+            return port.fileno()
+        except (AttributeError, NotImplementedError, OSError):
+            return None  # e.g. Windows backends expose no usable fd
+
+    @staticmethod
+    def _enable_low_latency(port):
+        """Ask the driver to shrink its USB latency timer (no-op if unsupported)."""
+        try:
+            port.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass  # Not supported on this platform/driver
+
     def _calculate_directional_packet(self, eye_x, eye_y):
         """
         Calculate directional packet from eye coordinates.
@@ -169,62 +275,136 @@ class ArduinoPWMSerialOutput:
             eye_y (int): Eye y coordinate
 
         Returns:
-            str: 8-character directional packet
+            bytes: 8-byte directional packet
         """
-        # Reference point is REFERENCE_OFFSET_PIXELS above center (after 180-degree rotation)
-        reference_x = self.frame_w // 2
-        reference_y = self.frame_h // 2 - REFERENCE_OFFSET_PIXELS
-
-        # Compute deltas relative to reference point
-        dx = eye_x - reference_x  # + = right,  - = left
-        dy = eye_y - reference_y  # + = down,   - = up
+        # Reference point is REFERENCE_OFFSET_PIXELS above center (after
+        # 180-degree rotation), precomputed once in __init__.
+        # Deltas: dx + = right, dy + = down.
+        dx = eye_x - self._ref_x
+        dy = eye_y - self._ref_y
+
+        if dx * dx + dy * dy <= self._deadzone_sq:
+            return _IN_ZONE  # Eye detected and in target zone
+
+        # Table indexes, clamped in case a landmark lands slightly outside
+        # the frame bounds
+        vi = dy + self._v_off
+        if vi < 0:
+            vi = 0
+        elif vi > self._v_max:
+            vi = self._v_max
+        hi = dx + self._h_off
+        if hi < 0:
+            hi = 0
+        elif hi > self._h_max:
+            hi = self._h_max
+
+        return self._v_half[vi] + self._h_half[hi]
 
-        # Check if within deadzone
-        distance = (dx**2 + dy**2) ** 0.5
-        if distance <= self.deadzone_pixels:
-            return "U000L000"  # Eye detected and in target zone
+    def send_packet(self, packet):
+        """
+        Queue packet for the background serial writer thread.
 
-        dir_v = "U" if dy <= 0 else "D"
-        dir_h = "L" if dx <= 0 else "R"
+        Skips the write entirely when the packet is identical to the last
+        one sent within the heartbeat interval.
 
-        dist_v = abs(dy)  # vertical magnitude
-        dist_h = abs(dx)  # horizontal magnitude
+        Args:
+            packet (bytes): 8-byte packet to send
+        """
+        now_ns = time.monotonic_ns()
+        if packet == self._last_packet and now_ns < self._next_heartbeat_ns:
+            return
+        try:
+            self._tx_queue.put_nowait(packet)
+            self._last_packet = packet
+            self._next_heartbeat_ns = now_ns + self._heartbeat_interval_ns
+        except queue.Full:
+            pass  # Writer is backlogged - drop this packet rather than block
+
+    def _tx_worker(self):
+        """Background thread that drains the packet queue onto the serial link."""
+        while True:
+            packet = self._tx_queue.get()
+            if packet is None:  # Shutdown sentinel from cleanup()
+                break
+
+            # Drain anything that queued up behind this packet and send the
+            # burst as one write - the Arduino parses fixed 8-byte frames,
+            # so concatenation is transparent and N syscalls become one
+            shutdown = False
+            try:
+                while True:
+                    extra = self._tx_queue.get_nowait()
+                    if extra is None:
+                        shutdown = True
+                        break
+                    packet += extra
+            except queue.Empty:
+                pass
 
-        return f"{dir_v}{dist_v:03d}{dir_h}{dist_h:03d}"
+            self._write_packet(packet)
+            if shutdown:
+                break
 
-    def send_packet(self, packet):
+    def _write_packet(self, packet):
         """
-        Send packet to Arduino via serial and/or WiFi.
+        Write packet to Arduino via serial, reconnecting on failure.
+
+        The fast path is one boolean check plus the write. On failure the
+        link is marked down and reconnects are attempted at most once per
+        cooldown period until the port comes back.
 
         Args:
-            packet (str): 8-character packet to send
+            packet (bytes): 8-byte packet to send
         """
-        # Send via serial if available
-        if self.arduino is not None:
+        if self.arduino is None:
+            return
+
+        # Fast path: link believed healthy, just write
+        if self._link_ok:
             try:
-                if not self.arduino.is_open:
-                    print("⚠️  Arduino connection closed - attempting to reconnect...")
-                    self.arduino.open()
-                self.arduino.write(packet.encode())
-                self.arduino.flush()  # Ensure packet is sent immediately
+                if self._arduino_fd is not None:
+                    # Raw fd write skips pyserial's Python-level wrapper
+                    # (locks, timeout bookkeeping, extra allocations)
+                    os.write(self._arduino_fd, packet)
+                else:
+                    self.arduino.write(packet)
+                    self.arduino.flush()  # Ensure packet is sent immediately
+                return
             except Exception as e:
                 print(f"⚠️  Failed to send packet '{packet}' via serial: {e}")
-                # Try to reconnect
-                try:
-                    print("🔄 Attempting to reconnect to Arduino...")
-                    if self.arduino:
-                        self.arduino.close()
-                    import serial
-
-                    self.arduino = serial.Serial(
-                        self.serial_port, self.baud_rate, timeout=1
-                    )
-                    print("✓ Serial reconnection successful")
-                except Exception as reconnect_error:
-                    print(f"❌ Serial reconnection failed: {reconnect_error}")
-                    print("📺 Continuing without serial communication")
-                    self.arduino = None
-        
+                self._link_ok = False
+                self._reconnect_at_ns = (
+                    time.monotonic_ns() + self._reconnect_cooldown_ns
+                )
+                return
+
+        # Recovery path: rate-limited reconnect attempts
+        if time.monotonic_ns() < self._reconnect_at_ns:
+            return  # Still cooling down from the last attempt
+        try:
+            print("🔄 Attempting to reconnect to Arduino...")
+            self.arduino.close()
+            self.arduino = serial.Serial(
+                self.serial_port,
+                self.baud_rate,
+                timeout=1,
+                write_timeout=self.write_timeout,
+            )
+            self._enable_low_latency(self.arduino)
+            self._arduino_fd = self._port_fd(self.arduino)
+            self._link_ok = True
+            print("✓ Serial reconnection successful")
+        except Exception as reconnect_error:
+            print(f"❌ Serial reconnection failed: {reconnect_error}")
+            # The board may have re-enumerated at a new device path; drop the
+            # memoized scan result so this rescan (and the next attempt) see it
+            find_arduino_port.cache_clear()
+            new_port = find_arduino_port()
+            if new_port is not None:
+                self.serial_port = new_port
+            self._reconnect_at_ns = time.monotonic_ns() + self._reconnect_cooldown_ns
+
         # Note: WiFi communication is handled by plotter state management
         # The Arduino only processes serial packets when plotter is enabled via WiFi
 
@@ -247,73 +427,21 @@ class ArduinoPWMSerialOutput:
         """
         Main loop for eye tracking and Arduino communication.
 
+        Dispatches once on debug_display, so the headless loop carries no
+        per-frame display branches at all.
+
         Args:
             debug_display (bool): Whether to show debug visualization
         """
         print("Starting eye tracking loop...")
         print("📱 Connect iOS app to Arduino WiFi (192.168.4.1) to control plotter")
         print("Press 'q' in the camera window or Ctrl+C to stop")
-        loop_count = 0
-        last_eye_status = None
-        last_status_check = 0
-        
-        try:
-            while True:
-                loop_count += 1
-                current_time = time.time()
-                
-                # Check plotter status periodically (every 5 seconds)
-                if current_time - last_status_check > 5:
-                    self.check_plotter_status()
-                    last_status_check = current_time
-
-                # Get eye location from model
-                try:
-                    eye_x, eye_y = self.eye_model.get_eye_location(debug_display=False)
-                except Exception as e:
-                    print(f"Error getting eye location: {e}")
-                    eye_x, eye_y = None, None
-
-                if eye_x is not None and eye_y is not None:
-                    # Calculate and send directional packet
-                    packet = self._calculate_directional_packet(eye_x, eye_y)
-                    if last_eye_status != "detected":
-                        last_eye_status = "detected"
-                else:
-                    # No eye detected
-                    packet = "N000N000"
-                    if last_eye_status != "not_detected":
-                        last_eye_status = "not_detected"
-
-                # Send packet to Arduino
-                self.send_packet(packet)
-
-                # Display frame with packet info if debug is enabled
-                if debug_display:
-                    try:
-                        # Create packet info with plotter status
-                        status_text = f"Plotter: {'ON' if self.plotter_enabled else 'OFF'}"
-                        if self.wifi_enabled:
-                            status_text += " (WiFi)"
-                        elif self.arduino:
-                            status_text += " (Serial)"
-                        else:
-                            status_text += " (No Connection)"
-                        
-                        packet_with_status = f"{packet} | {status_text}"
-                        self.eye_model.display_frame_with_packet(packet_with_status, eye_x, eye_y)
-                    except Exception as e:
-                        print(f"Error displaying camera frame: {e}")
-
-                # Check for quit command (only if debug display is enabled)
-                if debug_display:
-                    import cv2
-
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == ord("q"):
-                        print("Quit key pressed")
-                        break
 
+        try:
+            if debug_display:
+                self._run_with_display()
+            else:
+                self._run_headless()
         except KeyboardInterrupt:
             print("\n🛑 Interrupted by user")
         except Exception as e:
@@ -322,6 +450,98 @@ class ArduinoPWMSerialOutput:
             print("\n📴 Shutting down...")
             self.cleanup()
 
+    def _run_headless(self):
+        """Tight capture → packet → send loop with no display work."""
+        last_status_check = 0
+
+        # Bind hot attributes to locals so the per-frame loop does
+        # LOAD_FAST instead of repeated two-level attribute lookups
+        get_eye_location = self.eye_model.get_eye_location
+        calculate_packet = self._calculate_directional_packet
+        send_packet = self.send_packet
+        neutral = _NEUTRAL
+
+        while True:
+            current_time = time.time()
+
+            # Check plotter status periodically (every 5 seconds)
+            if current_time - last_status_check > 5:
+                self.check_plotter_status()
+                last_status_check = current_time
+
+            # Get eye location from model
+            try:
+                eye_x, eye_y = get_eye_location(debug_display=False)
+            except Exception as e:
+                print(f"Error getting eye location: {e}")
+                eye_x, eye_y = None, None
+
+            if eye_x is not None and eye_y is not None:
+                packet = calculate_packet(eye_x, eye_y)
+            else:
+                packet = neutral
+
+            # Send packet to Arduino
+            send_packet(packet)
+
+    def _run_with_display(self):
+        """Tracking loop with the local debug window and quit-key handling."""
+        last_status_check = 0
+
+        # Bind hot attributes to locals so the per-frame loop does
+        # LOAD_FAST instead of repeated two-level attribute lookups
+        get_eye_location = self.eye_model.get_eye_location
+        calculate_packet = self._calculate_directional_packet
+        send_packet = self.send_packet
+        display_packet = self.eye_model.display_frame_with_packet
+        neutral = _NEUTRAL
+
+        while True:
+            current_time = time.time()
+
+            # Check plotter status periodically (every 5 seconds)
+            if current_time - last_status_check > 5:
+                self.check_plotter_status()
+                last_status_check = current_time
+
+            # Get eye location from model
+            try:
+                eye_x, eye_y = get_eye_location(debug_display=False)
+            except Exception as e:
+                print(f"Error getting eye location: {e}")
+                eye_x, eye_y = None, None
+
+            if eye_x is not None and eye_y is not None:
+                packet = calculate_packet(eye_x, eye_y)
+            else:
+                packet = neutral
+
+            # Send packet to Arduino
+            send_packet(packet)
+
+            # Display frame with packet info
+            try:
+                # Create packet info with plotter status
+                status_text = f"Plotter: {'ON' if self.plotter_enabled else 'OFF'}"
+                if self.wifi_enabled:
+                    status_text += " (WiFi)"
+                elif self.arduino:
+                    status_text += " (Serial)"
+                else:
+                    status_text += " (No Connection)"
+
+                packet_with_status = f"{packet.decode()} | {status_text}"
+                display_packet(packet_with_status, eye_x, eye_y)
+            except Exception as e:
+                print(f"Error displaying camera frame: {e}")
+
+            # Check for quit command - pollKey is non-blocking, unlike
+            # waitKey(1) which can stall the loop for ~15 ms per call
+            key = cv2.pollKey() & 0xFF
+            if key == ord("q"):
+                print("Quit key pressed")
+                break
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals gracefully."""
         print(f"\n🛑 Received signal {signum}, initiating cleanup...")
@@ -337,6 +557,16 @@ class ArduinoPWMSerialOutput:
 
         print("\n🧹 Starting comprehensive cleanup...")
 
+        # Step 0: Stop the background serial writer so it can't interleave
+        # with the final neutral packet
+        try:
+            if hasattr(self, "_tx_thread") and self._tx_thread.is_alive():
+                self._tx_queue.put(None, timeout=0.5)  # Shutdown sentinel
+                self._tx_thread.join(timeout=1)
+                print("✓ Serial writer thread stopped")
+        except Exception as e:
+            print(f"⚠️  Error stopping serial writer thread: {e}")
+
         # Step 1: Send neutral signal to Arduino before shutdown
         try:
             if hasattr(self, "arduino") and self.arduino and self.arduino.is_open:
@@ -376,8 +606,6 @@ class ArduinoPWMSerialOutput:
 
         # Step 4: Final OpenCV cleanup
         try:
-            import cv2
-
             cv2.destroyAllWindows()
             # Multiple waitKey calls to ensure cleanup
             for _ in range(10):
@@ -451,8 +679,6 @@ def main():
 
         # Final system cleanup
         try:
-            import cv2
-
             cv2.destroyAllWindows()
             for _ in range(5):
                 cv2.waitKey(1)
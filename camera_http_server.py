@@ -14,6 +14,9 @@ import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="google.protobuf")
 
 import cv2
+import numpy as np
+import functools
+import json
 import threading
 import time
 import socket
@@ -24,16 +27,87 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 from eye_detection_model import EyeDetectionModel
 
+# Optional: simplejpeg wraps libjpeg-turbo's SIMD DCT/Huffman kernels and
+# encodes noticeably faster than cv2.imencode on the same quality setting.
+# The server works fine without it - encoding just falls back to OpenCV.
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 # Global configuration
 SERVER_PORT = 8081
 CAMERA_INDEX = 1  # External camera
 FRAME_WIDTH = 640
 FRAME_HEIGHT = 480
 REFERENCE_OFFSET_PIXELS = 210  # Pixels above center for target reference point
+JPEG_QUALITY = 85
+
+# Multipart header template: everything but the payload length is constant,
+# so each frame's header is one bytes-formatting operation
+_MJPEG_PART_HEADER = (
+    b'--jpgboundary\r\n'
+    b'Content-Type: image/jpeg\r\n'
+    b'Content-Length: %d\r\n\r\n'
+)
+
+# Encode params built once at import. 4:2:0 chroma subsampling halves the
+# chroma bytes pushed through the encoder and is standard for MJPEG; the
+# constant only exists on newer OpenCV builds, hence the guard.
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
+if hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+    _JPEG_PARAMS += [
+        cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+        cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+    ]
+
+
+def _encode_jpeg(frame):
+    """
+    Encode a BGR frame to JPEG bytes.
+
+    Uses simplejpeg (libjpeg-turbo) when installed, otherwise cv2.imencode.
+    Both paths produce 4:2:0 JPEG where the build supports it; on the
+    simplejpeg path the frame is converted to I420 first so the encoder
+    skips its own color conversion and moves half the chroma bytes.
+
+    Args:
+        frame: BGR image array
+
+    Returns:
+        bytes: JPEG data, or None if encoding failed
+    """
+    if simplejpeg is not None:
+        h, w = frame.shape[:2]
+        # encode_jpeg_yuv_planes only exists in newer simplejpeg releases -
+        # an older install must fall through, not raise AttributeError
+        if h % 2 == 0 and w % 2 == 0 and hasattr(simplejpeg, "encode_jpeg_yuv_planes"):
+            i420 = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+            quarter = (h // 2) * (w // 2)
+            chroma = i420[h:].reshape(-1)
+            return simplejpeg.encode_jpeg_yuv_planes(
+                np.ascontiguousarray(i420[:h]),
+                np.ascontiguousarray(chroma[:quarter].reshape(h // 2, w // 2)),
+                np.ascontiguousarray(chroma[quarter:].reshape(h // 2, w // 2)),
+                quality=JPEG_QUALITY,
+                fastdct=True,
+            )
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame),
+            quality=JPEG_QUALITY,
+            colorspace="BGR",
+            fastdct=True,
+        )
+    ret, buffer = cv2.imencode(".jpg", frame, _JPEG_PARAMS)
+    return buffer.tobytes() if ret else None
 
 class CameraStreamHandler(BaseHTTPRequestHandler):
     """HTTP request handler for camera streaming."""
-    
+
+    # MJPEG parts are small; without this Nagle batches them and adds up to
+    # ~200 ms of latency per boundary write on Wi-Fi clients
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         """Handle GET requests for camera stream."""
         if self.path == '/stream.mjpeg':
@@ -57,21 +131,26 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         if hasattr(self.server, 'camera_server') and self.server.camera_server:
             frame = self.server.camera_server.get_latest_frame()
             if frame is not None:
-                ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                if ret:
-                    self.wfile.write(buffer.tobytes())
+                jpg = _encode_jpeg(frame)
+                if jpg is not None:
+                    self.wfile.write(jpg)
                     return
-        
+
         # Send a simple test pattern if no camera
-        import numpy as np
         test_image = np.zeros((240, 320, 3), dtype=np.uint8)
         test_image[60:180, 80:240] = [0, 255, 0]  # Green rectangle
-        ret, buffer = cv2.imencode('.jpg', test_image)
-        if ret:
-            self.wfile.write(buffer.tobytes())
+        jpg = _encode_jpeg(test_image)
+        if jpg is not None:
+            self.wfile.write(jpg)
     
     def send_mjpeg_stream(self):
         """Send MJPEG camera stream."""
+        try:
+            # Room for a whole JPEG in the kernel send buffer so each frame
+            # leaves in one send instead of dribbling out
+            self.request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        except OSError:
+            pass  # Not fatal - stream just uses the default buffer
         self.send_response(200)
         self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=--jpgboundary')
         self.send_header('Cache-Control', 'no-cache')
@@ -80,26 +159,35 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         self.end_headers()
         
         try:
+            last_seq = 0
             while True:
-                if hasattr(self.server, 'camera_server') and self.server.camera_server:
-                    frame = self.server.camera_server.get_latest_frame()
-                    if frame is not None:
-                        # Encode frame as JPEG
-                        ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                        if ret:
-                            try:
-                                self.wfile.write(b'--jpgboundary\r\n')
-                                self.wfile.write(f'Content-Type: image/jpeg\r\n'.encode())
-                                self.wfile.write(f'Content-Length: {len(buffer)}\r\n\r\n'.encode())
-                                self.wfile.write(buffer.tobytes())
-                                self.wfile.write(b'\r\n')
-                                self.wfile.flush()
-                            except (BrokenPipeError, ConnectionResetError):
-                                # Client disconnected - exit gracefully
-                                break
-                
-                time.sleep(1/15)  # 15 FPS for better compatibility
-                
+                camera_server = getattr(self.server, 'camera_server', None)
+                if camera_server is None:
+                    time.sleep(0.1)
+                    continue
+
+                # Block until the capture loop publishes a new frame - no
+                # sleep-polling, no resending stale frames. Pre-encoded by
+                # the capture loop, so every client shares the same bytes.
+                # Slow clients self-regulate: while one is stuck in write(),
+                # newer frames overwrite the slot, and on wake it jumps to
+                # the newest seq - frames are skipped, never queued.
+                jpg, last_seq = camera_server.wait_for_jpeg(last_seq)
+                if not camera_server.running:
+                    break
+                if jpg is None:
+                    continue
+
+                try:
+                    # One write per frame instead of five: header, payload,
+                    # and trailer leave as a single contiguous chunk, which
+                    # with Nagle disabled is typically one segment per frame
+                    self.wfile.write(_MJPEG_PART_HEADER % len(jpg) + jpg + b'\r\n')
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client disconnected - exit gracefully
+                    break
+
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
             # Normal disconnection - don't log as error
             pass
@@ -118,16 +206,23 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
             "camera": "connected" if hasattr(self.server, 'camera_server') and self.server.camera_server else "disconnected",
             "stream_url": f"http://{get_local_ip()}:{SERVER_PORT}/stream.mjpeg"
         }
-        
-        import json
+
         self.wfile.write(json.dumps(status).encode())
     
+    # Viewer page rendered to bytes on first request and reused after -
+    # the content only depends on the (cached) local IP and server port
+    _html_page = None
+
     def send_html_viewer(self):
         """Send a simple HTML viewer for testing."""
         self.send_response(200)
         self.send_header('Content-Type', 'text/html')
         self.end_headers()
-        
+
+        if CameraStreamHandler._html_page is not None:
+            self.wfile.write(CameraStreamHandler._html_page)
+            return
+
         html = f"""
         <!DOCTYPE html>
         <html>
@@ -146,14 +241,24 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         </body>
         </html>
         """
-        self.wfile.write(html.encode())
+        CameraStreamHandler._html_page = html.encode()
+        self.wfile.write(CameraStreamHandler._html_page)
     
     def log_message(self, format, *args):
         """Override to reduce HTTP request logging."""
         pass  # Suppress HTTP request logs
 
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
-    """Threading HTTP server for handling multiple connections."""
+    """
+    Threading HTTP server for handling multiple connections.
+
+    Thread-per-client is a deliberate choice over an asyncio/aiohttp
+    rewrite: the handful of viewers this serves spend their time in
+    socket sends (GIL released), frames arrive pre-encoded, and the
+    Condition-based frame wait means idle handlers cost nothing. An
+    event loop would add a dependency and a thread bridge from the
+    capture loop for no measurable win at this scale.
+    """
     allow_reuse_address = True
     daemon_threads = True
     
@@ -187,7 +292,11 @@ class CameraStreamServer:
         self.camera_index = camera_index
         self.deadzone_pixels = deadzone_pixels
         self.latest_frame = None
-        self.frame_lock = threading.Lock()
+        self.latest_jpeg = None
+        # Condition doubles as the frame lock; frame_seq lets consumers
+        # wait for exactly the next published frame instead of sleep-polling
+        self.frame_cond = threading.Condition()
+        self.frame_seq = 0
         self.running = False
         self.capture_thread = None
         self.eye_model = None
@@ -204,9 +313,34 @@ class CameraStreamServer:
                 frame_height=FRAME_HEIGHT,
                 camera_index=camera_index,
                 deadzone_pixels=deadzone_pixels,
-                reference_offset_pixels=REFERENCE_OFFSET_PIXELS
+                reference_offset_pixels=REFERENCE_OFFSET_PIXELS,
+                # Run FaceMesh on a 320x240 downscale - landmarks are
+                # normalized, so pixel coordinates stay full-resolution
+                detection_scale=2,
+                # Overlap cap.read() with inference: the model's reader
+                # thread captures while the capture loop runs FaceMesh
+                threaded_capture=True
             )
             print("✅ Eye detection model initialized successfully")
+
+            # Everything derivable from the fixed 640x480 geometry is
+            # computed once here - reference point, squared deadzone, and
+            # the rasterized static overlay below. This is the same payoff
+            # a shape-specialized compiled kernel would give, minus the
+            # compiler: the per-frame path only touches finished values.
+            # The reference dot and deadzone ring never move, so rasterize
+            # them once into an overlay + mask and blit per frame instead of
+            # redrawing two circles every tick
+            ref_x = FRAME_WIDTH // 2
+            ref_y = FRAME_HEIGHT // 2 - REFERENCE_OFFSET_PIXELS
+            self._ref_x = ref_x
+            self._ref_y = ref_y
+            self._dz_sq = deadzone_pixels * deadzone_pixels
+            self._static_overlay = np.zeros((FRAME_HEIGHT, FRAME_WIDTH, 3), np.uint8)
+            self._static_mask = np.zeros((FRAME_HEIGHT, FRAME_WIDTH), np.uint8)
+            for img, color in ((self._static_overlay, (255, 0, 0)), (self._static_mask, 255)):
+                cv2.circle(img, (ref_x, ref_y), 3, color, -1)
+                cv2.circle(img, (ref_x, ref_y), deadzone_pixels, color, 2)
         except Exception as e:
             print(f"❌ Failed to initialize eye detection model: {e}")
             print(f"💡 Troubleshooting tips:")
@@ -249,13 +383,18 @@ class CameraStreamServer:
             return
             
         self.running = True
-        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread = threading.Thread(
+            target=self._capture_loop, daemon=True, name="camera-capture"
+        )
         self.capture_thread.start()
         print("✓ Camera capture started")
     
     def stop(self):
         """Stop camera capture."""
         self.running = False
+        # Release any handler threads blocked waiting for the next frame
+        with self.frame_cond:
+            self.frame_cond.notify_all()
         if self.capture_thread:
             self.capture_thread.join(timeout=2)
         if self.eye_model:
@@ -263,16 +402,60 @@ class CameraStreamServer:
         print("✓ Camera capture stopped")
     
     def get_latest_frame(self):
-        """Get the latest camera frame."""
-        with self.frame_lock:
-            return self.latest_frame.copy() if self.latest_frame is not None else None
+        """
+        Get the latest camera frame.
+
+        Returns the published array itself, not a copy: the capture loop
+        builds each annotated frame in a fresh buffer and never touches it
+        again after publication, so readers see a stable snapshot. Treat
+        the result as read-only.
+        """
+        with self.frame_cond:
+            return self.latest_frame
+
+    def get_latest_jpeg(self):
+        """Get the latest frame pre-encoded as JPEG bytes (no copy - immutable)."""
+        with self.frame_cond:
+            return self.latest_jpeg
+
+    def wait_for_jpeg(self, last_seq, timeout=1.0):
+        """
+        Block until a frame newer than last_seq is published.
+
+        Args:
+            last_seq (int): Sequence number of the last frame the caller sent
+            timeout (float): Max seconds to wait (guards against a stalled
+                capture loop keeping clients blocked forever)
+
+        Returns:
+            tuple: (jpeg_bytes or None, new_seq)
+        """
+        with self.frame_cond:
+            self.frame_cond.wait_for(
+                lambda: self.frame_seq != last_seq or not self.running,
+                timeout=timeout,
+            )
+            return self.latest_jpeg, self.frame_seq
     
     def _capture_loop(self):
         """Main camera capture loop."""
+        # Best-effort priority bump so a burst of client traffic can't
+        # starve the 30 FPS producer. Needs privileges on most systems and
+        # os.nice is process-wide on macOS, so failure is just ignored;
+        # core pinning (sched_setaffinity) is Linux-only and deliberately
+        # skipped - the usual deployment here is a macOS laptop.
+        try:
+            import os
+            os.nice(-5)
+        except (AttributeError, PermissionError, OSError):
+            pass
+
         frame_count = 0
         last_eye_status = None
         consecutive_errors = 0
         max_consecutive_errors = 10
+        period = 1 / 30
+        next_t = time.perf_counter()
         
         print("🎬 Starting camera capture loop...")
         
@@ -286,38 +469,35 @@ class CameraStreamServer:
                     frame = None
                     
                     try:
-                        eye_x, eye_y = self.eye_model.get_eye_location(debug_display=False)
+                        # Single grab + detect: the frame returned is the
+                        # one detection actually ran on, so overlays and eye
+                        # coords are never a frame apart
+                        frame, eye_x, eye_y = self.eye_model.process_one()
                         consecutive_errors = 0  # Reset error counter on success
                     except Exception as e:
                         consecutive_errors += 1
                         if consecutive_errors <= 3:  # Only log first few errors
-                            print(f"⚠️ Error getting eye location (attempt {consecutive_errors}): {e}")
-                        
+                            print(f"⚠️ Error processing frame (attempt {consecutive_errors}): {e}")
+
                         if consecutive_errors >= max_consecutive_errors:
                             print(f"❌ Too many consecutive errors ({consecutive_errors}), stopping capture")
                             break
-                    
-                    # Get the current frame for streaming
-                    try:
-                        frame = self.eye_model.get_current_frame()
-                    except Exception as e:
-                        print(f"⚠️ Error getting current frame: {e}")
                         time.sleep(1/30)
                         continue
-                    
+
                     if frame is None:
                         if frame_count % 30 == 0:  # Log every 30 frames
                             print(f"⚠️ No frame available at frame {frame_count}")
                         time.sleep(1/30)
                         continue
                     
-                    # Create annotated frame for streaming
-                    try:
-                        annotated_frame = frame.copy()
-                    except Exception as e:
-                        print(f"⚠️ Error copying frame: {e}")
-                        continue
-                    
+                    # process_one hands over the captured buffer itself (the
+                    # next grab lands in a fresh array), so the draw calls
+                    # below stamp it in place with no full-frame memcpy. The
+                    # cv2 draw/encode calls run in C++ with the GIL released,
+                    # so HTTP threads keep serving.
+                    annotated_frame = frame
+
                     # Add eye tracking visualizations
                     if eye_x is not None and eye_y is not None:
                         # Draw eye center
@@ -334,21 +514,25 @@ class CameraStreamServer:
                         if last_eye_status != "not_detected":
                             last_eye_status = "not_detected"
                     
-                    # Add reference point and deadzone visualization
-                    ref_x = FRAME_WIDTH // 2
-                    ref_y = FRAME_HEIGHT // 2 - REFERENCE_OFFSET_PIXELS
-                    cv2.circle(annotated_frame, (ref_x, ref_y), 3, (255, 0, 0), -1)  # Blue reference point
-                    cv2.circle(annotated_frame, (ref_x, ref_y), self.deadzone_pixels, (255, 0, 0), 2)  # Blue deadzone circle
-                    
+                    # Blit the pre-rasterized reference point + deadzone ring
+                    cv2.copyTo(self._static_overlay, self._static_mask, annotated_frame)
+
                     # Add text overlay
                     cv2.putText(annotated_frame, status_text, (10, 30), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
                     cv2.putText(annotated_frame, f"Frame: {frame_count} | iOS Stream Active", (10, 60), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
                 
-                    # Update latest frame for streaming
-                    with self.frame_lock:
+                    # Encode once here so N connected clients share one JPEG
+                    # instead of each re-encoding the same frame
+                    jpg = _encode_jpeg(annotated_frame)
+
+                    # Publish and wake every client waiting on this frame
+                    with self.frame_cond:
                         self.latest_frame = annotated_frame
+                        self.latest_jpeg = jpg
+                        self.frame_seq += 1
+                        self.frame_cond.notify_all()
                     
                     # Show local preview window (disabled due to macOS OpenCV issues)
                     # try:
@@ -365,8 +549,18 @@ class CameraStreamServer:
                     if frame_count % 30 == 0:  # Every 30 frames (1 second at 30fps)
                         print(f"📸 Frame {frame_count}: {status_text}")
                     
-                    time.sleep(1/30)  # 30 FPS
-                
+                    # Deadline-based pacing: sleeping a fixed 1/30 s after
+                    # each iteration would drift by the processing time
+                    # (actual FPS = 1/(1/30 + t_proc)). Sleeping until the
+                    # next deadline holds a true 30 FPS cadence; if the loop
+                    # falls badly behind, resync instead of bursting
+                    next_t += period
+                    delay = next_t - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    elif delay < -0.1:
+                        next_t = time.perf_counter()  # resync after a stall
+
                 except Exception as e:
                     consecutive_errors += 1
                     if consecutive_errors <= 3:
@@ -391,29 +585,29 @@ class CameraStreamServer:
     
     def _calculate_directional_packet(self, eye_x, eye_y):
         """Calculate directional packet from eye coordinates."""
-        # Reference point is REFERENCE_OFFSET_PIXELS above center
-        reference_x = FRAME_WIDTH // 2
-        reference_y = FRAME_HEIGHT // 2 - REFERENCE_OFFSET_PIXELS
-        
-        # Compute deltas relative to reference point
-        dx = eye_x - reference_x  # + = right,  - = left
-        dy = eye_y - reference_y  # + = down,   - = up
-        
-        # Check if within deadzone
-        distance = (dx**2 + dy**2) ** 0.5
-        if distance <= self.deadzone_pixels:
+        # Pure Python on purpose: this builds the overlay's status string at
+        # 30 Hz, nowhere near rates where a compiled kernel would register
+        # Compute deltas relative to the precomputed reference point
+        dx = int(eye_x) - self._ref_x  # + = right,  - = left
+        dy = int(eye_y) - self._ref_y  # + = down,   - = up
+
+        # Squared-distance deadzone check - no float sqrt in the hot path
+        if dx * dx + dy * dy <= self._dz_sq:
             return "U000L000"  # Eye detected and in target zone
-        
+
         dir_v = "U" if dy <= 0 else "D"
         dir_h = "L" if dx <= 0 else "R"
-        
-        dist_v = abs(dy)  # vertical magnitude
-        dist_h = abs(dx)  # horizontal magnitude
-        
+
+        # Clamp to 999 so the 3-digit field can never widen
+        dist_v = min(abs(dy), 999)  # vertical magnitude
+        dist_h = min(abs(dx), 999)  # horizontal magnitude
+
         return f"{dir_v}{dist_v:03d}{dir_h}{dist_h:03d}"
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get the local IP address of this machine."""
+    """Get the local IP address of this machine (cached - opening a UDP
+    socket per request is a wasted syscall round trip)."""
     try:
         # Connect to a remote address to determine local IP
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -24,6 +24,10 @@ class EyeDetectionModel:
         camera_index=1,
         deadzone_pixels=10,
         reference_offset_pixels=200,
+        detection_scale=1,
+        threaded_capture=False,
+        inference_interval=1,
+        display_enabled=True,
     ):
         """
         Initialize the eye detection model.
@@ -34,15 +38,59 @@ class EyeDetectionModel:
             camera_index (int): Camera index for cv2.VideoCapture
             deadzone_pixels (int): Deadzone radius in pixels around frame center
             reference_offset_pixels (int): Pixels above center for target reference point
+            detection_scale (int): Downsample factor applied to frames before
+                face-mesh inference (1 = full resolution). Inference cost
+                scales with pixel count, and landmarks are normalized, so
+                eye coordinates stay in full-resolution pixels.
+            threaded_capture (bool): Run cap.read() in a daemon thread that
+                publishes only the newest frame. Decouples inference cadence
+                from camera delivery, so a slow consumer never processes a
+                stale queued frame. Off by default - the entry points here
+                already pace their own loops.
+            inference_interval (int): Run full FaceMesh inference on every
+                Nth frame and advance the eye center with Lucas-Kanade
+                optical flow in between (1 = infer every frame). Eyes move
+                slowly relative to 30 fps, so small intervals (2-3) cut ML
+                inference cost proportionally with little accuracy loss.
+            display_enabled (bool): Allow display_frame_with_packet to open
+                a debug window. Pass False for headless deployments to skip
+                the overlay composition, imshow, and the ~1ms waitKey stall
+                entirely.
         """
         self.frame_w = frame_width
         self.frame_h = frame_height
         self.deadzone_pixels = deadzone_pixels
         self.reference_offset_pixels = reference_offset_pixels
+        self.detection_scale = max(1, int(detection_scale))
+
+        # Reference geometry derived once - the display path checks the
+        # deadzone every frame and shouldn't redo this arithmetic (or take
+        # a square root) each time
+        self._ref_x = frame_width // 2
+        self._ref_y = frame_height // 2 - reference_offset_pixels
+        self._dz_sq = deadzone_pixels * deadzone_pixels
+
+        # [w, h] scale vector for mapping normalized landmark coordinates
+        # to pixels in one vectorized multiply
+        self._lm_scale = np.array([frame_width, frame_height], np.float32)
+
+        # Reused BGR->RGB destination sized to the inference resolution -
+        # cvtColor writes into this instead of allocating ~900KB per frame
+        self._rgb_buf = np.empty(
+            (frame_height // self.detection_scale, frame_width // self.detection_scale, 3),
+            np.uint8,
+        )
 
         # MediaPipe face mesh initialization with iris landmarks
         self.mp_face_mesh = mp.solutions.face_mesh
+        # static_image_mode=False keeps MediaPipe in video-tracking mode:
+        # the (expensive) face detector only runs when tracking is lost,
+        # with cheap landmark tracking in between. refine_landmarks must
+        # stay True - turning it off removes the iris landmarks (468/473)
+        # that the eye-center math below is built on. For cheaper inference
+        # use detection_scale instead, which shrinks the input frame.
         self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
             max_num_faces=1,
             refine_landmarks=True,  # Enable iris landmarks
             min_detection_confidence=0.5,
@@ -57,6 +105,17 @@ class EyeDetectionModel:
         self.LEFT_IRIS = [474, 475, 476, 477, 473]
         self.RIGHT_IRIS = [469, 470, 471, 472, 468]
 
+        # Eye-type -> iris-center index, so per-frame visibility checks
+        # don't re-branch over the eye selection
+        self._center_idx = {
+            "left": self.LEFT_IRIS_CENTER,
+            "right": self.RIGHT_IRIS_CENTER,
+        }
+        # Whether this MediaPipe build populates presence/visibility is a
+        # property of the build, not the frame - resolved once on first use
+        self._has_presence = None
+        self._has_visibility = None
+
         # Eyelid landmark indices for head-position-independent eye center detection
         self.LEFT_EYELID = [
             362,
@@ -142,8 +201,17 @@ class EyeDetectionModel:
             )
 
         # Set camera properties
+        # Ask the camera to deliver MJPEG: UVC cameras compress on-board, so
+        # the USB link carries JPEG instead of raw YUYV - higher sustainable
+        # frame rates and less bus bandwidth. Ignored if unsupported.
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_w)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_h)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        # Keep at most one frame queued in the driver: with the default
+        # multi-frame buffer, cap.read() returns stale frames whenever the
+        # consumer lags, which shows up as control-loop latency
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         # Verify final camera settings
         actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -153,6 +221,24 @@ class EyeDetectionModel:
         # Store last frame and packet for display
         self.last_frame = None
         self.last_packet = None
+        # Whether the most recent get_eye_location call consumed a fresh
+        # frame - lets process_one avoid handing back an already-published
+        # frame when a grab fails or times out
+        self._fresh_frame = False
+        # Landmarks from the most recent successful inference, reused by
+        # the debug display so FaceMesh never runs twice on one frame
+        self._last_landmarks = None
+
+        # Headless deployments can disable the debug window entirely
+        self.display_enabled = bool(display_enabled)
+
+        # Scratch buffer the display overlay is composed into, allocated
+        # on first use - saves a ~900KB allocation per displayed frame
+        self._display_buf = None
+
+        # Pre-rasterized text stamps for the display overlay, keyed by
+        # (text, scale, color, thickness) - only repeated labels land here
+        self._stamp_cache = {}
 
         # Eye tracking selection with simple visibility-based switching
         self.active_eye = "left"  # 'left' or 'right'
@@ -162,6 +248,29 @@ class EyeDetectionModel:
         # Eye center calculation mode: 'iris' (pupil-based) or 'eyelid' (head-position-independent)
         self.center_mode = "eyelid"  # Default to eyelid tracking
 
+        # Optical-flow tracking state for skipping FaceMesh between
+        # inference frames - previous grayscale frame and tracked eye
+        # center, both at inference resolution
+        self.inference_interval = max(1, int(inference_interval))
+        self._flow_idx = 0
+        self._prev_gray = None
+        self._prev_pt = None
+
+        # Optional capture thread: drains the driver queue continuously and
+        # keeps only the newest frame in a single slot, so inference never
+        # runs on a frame the camera delivered while we were busy
+        self.threaded_capture = bool(threaded_capture)
+        self._frame_lock = threading.Lock()
+        self._latest_capture = None
+        self._capture_ready = threading.Event()
+        self._capture_stop = threading.Event()
+        self._capture_thread = None
+        if self.threaded_capture:
+            self._capture_thread = threading.Thread(
+                target=self._capture_reader, daemon=True, name="camera-reader"
+            )
+            self._capture_thread.start()
+
         # Cleanup tracking
         self._cleanup_called = False
         self._cleanup_lock = threading.Lock()
@@ -169,6 +278,63 @@ class EyeDetectionModel:
         # Register cleanup on exit
         atexit.register(self.cleanup)
 
+    def set_buffer_size(self, buffer_size):
+        """
+        Limit the camera driver's internal frame queue.
+
+        A deep capture buffer makes tracking lag reality: each read returns
+        the oldest queued frame, so processing delay compounds over time.
+        A single-frame buffer keeps reads close to live.
+
+        Args:
+            buffer_size (int): Number of frames the driver may queue
+
+        Returns:
+            bool: True if the capture backend accepted the setting
+        """
+        if self.cap is None:
+            return False
+        return bool(self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size))
+
+    def _capture_reader(self):
+        """
+        Capture-thread loop: read frames as fast as the camera delivers
+        them and overwrite the single-slot buffer with the newest one.
+        """
+        while not self._capture_stop.is_set():
+            try:
+                ok, frame = self.cap.read()
+            except Exception:
+                break
+            if not ok or frame is None:
+                time.sleep(0.01)
+                continue
+            with self._frame_lock:
+                self._latest_capture = frame
+            self._capture_ready.set()
+
+    def _read_frame(self):
+        """
+        Get the next frame to process: newest-wins from the capture thread
+        when enabled, otherwise a direct blocking cap.read().
+
+        Returns:
+            numpy.ndarray: BGR frame, or None if no frame is available
+        """
+        if not self.threaded_capture:
+            ok, frame = self.cap.read()
+            return frame if ok else None
+
+        # Wait for a frame published since our last take; clear before
+        # taking so a frame arriving mid-take re-arms the event
+        if not self._capture_ready.wait(timeout=1.0):
+            return None
+        self._capture_ready.clear()
+        with self._frame_lock:
+            frame = self._latest_capture
+            self._latest_capture = None
+        return frame
+
     def _is_eye_visible(self, landmarks, eye_type):
         """
         Simple visibility check for an eye.
@@ -181,14 +347,7 @@ class EyeDetectionModel:
             bool: True if eye is visible and trackable, False otherwise
         """
         try:
-            if eye_type == "left":
-                center_idx = self.LEFT_IRIS_CENTER
-                iris_indices = self.LEFT_IRIS
-            else:
-                center_idx = self.RIGHT_IRIS_CENTER
-                iris_indices = self.RIGHT_IRIS
-
-            center = landmarks[center_idx]
+            center = landmarks[self._center_idx[eye_type]]
 
             # For iris landmarks, confidence values are often 0.0, so we primarily use coordinate-based detection
             # If the iris center has reasonable coordinates, assume it's visible
@@ -198,15 +357,21 @@ class EyeDetectionModel:
             if coords_valid:
                 return True
 
-            # Fallback: Use confidence if coordinates seem invalid
+            # Fallback: Use confidence if coordinates seem invalid.
+            # hasattr walks the protobuf descriptor, so probe it once and
+            # reuse the answer on later frames
+            if self._has_presence is None:
+                self._has_presence = hasattr(center, "presence")
+                self._has_visibility = hasattr(center, "visibility")
+
             if (
-                hasattr(center, "presence")
+                self._has_presence
                 and center.presence is not None
                 and center.presence > 0.1
             ):
                 return True
             elif (
-                hasattr(center, "visibility")
+                self._has_visibility
                 and center.visibility is not None
                 and center.visibility > 0.05
             ):
@@ -217,6 +382,137 @@ class EyeDetectionModel:
         except Exception as e:
             return False
 
+    def _blit_text(self, frame, text, org, scale, color, thickness=2):
+        """
+        Draw text from a cached pre-rasterized stamp.
+
+        cv2.putText re-rasterizes Hershey glyph strokes on every call;
+        for labels repeated across frames, rendering once into a small
+        stamp and masked-copying it in reduces the work to a memory copy.
+        The cache only ever holds the handful of label/color combinations
+        the overlay uses.
+
+        Args:
+            frame: BGR frame to draw into
+            text (str): Text to render
+            org (tuple): Baseline origin (x, y), as for cv2.putText
+            scale (float): Font scale
+            color (tuple): BGR color
+            thickness (int): Stroke thickness
+
+        Returns:
+            int: Rendered text width in pixels
+        """
+        key = (text, scale, color, thickness)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            (tw, th), base = cv2.getTextSize(
+                text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+            )
+            img = np.zeros((th + base, tw, 3), np.uint8)
+            cv2.putText(
+                img, text, (0, th), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness
+            )
+            stamp = (img, img.any(axis=2)[..., None], tw, th)
+            self._stamp_cache[key] = stamp
+
+        img, mask, tw, th = stamp
+        x, y = org[0], org[1] - th
+        h, w = img.shape[:2]
+        roi = frame[y : y + h, x : x + w]
+        if roi.shape[:2] == (h, w):  # Skip stamps that would clip the edge
+            np.copyto(roi, img, where=mask)
+        return tw
+
+    def _flow_track(self, frame):
+        """
+        Advance the tracked eye center with optical flow instead of
+        running FaceMesh, on frames between full inferences.
+
+        Args:
+            frame: BGR frame at inference resolution
+
+        Returns:
+            tuple: (x, y) eye center in full-resolution pixels, or None
+                when full inference is due (or tracking was lost)
+        """
+        if self._prev_gray is None or self._prev_pt is None:
+            return None  # Nothing to track yet - inference must (re)seed
+        if self._flow_idx % self.inference_interval == 0:
+            return None  # Full inference due this frame
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        pt, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray,
+            gray,
+            self._prev_pt,
+            None,
+            winSize=(15, 15),
+            maxLevel=2,
+        )
+        if status is None or not status.ravel()[0]:
+            # Lost the point - drop the state and fall back to inference
+            self._prev_gray = None
+            self._prev_pt = None
+            return None
+
+        self._prev_gray = gray
+        self._prev_pt = pt
+        x, y = pt.ravel()
+        k = self.detection_scale
+        return int(x * k), int(y * k)
+
+    def _seed_flow(self, frame, ex, ey):
+        """
+        Store the optical-flow starting state from an inference frame.
+
+        Args:
+            frame: BGR frame at inference resolution
+            ex (int): Eye center x in full-resolution pixels
+            ey (int): Eye center y in full-resolution pixels
+        """
+        k = self.detection_scale
+        self._prev_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self._prev_pt = np.array([[[ex / k, ey / k]]], np.float32)
+
+    def _gather_px(self, lm, indices):
+        """
+        Gather selected landmarks into an (N, 2) pixel-coordinate array.
+
+        Each landmarks[i].x access crosses into protobuf property
+        descriptors; doing it once here and handing NumPy the rest keeps
+        that overhead to a single pass per frame, shared between the eye
+        center math and the visualization drawing.
+
+        Args:
+            lm: MediaPipe landmark list
+            indices (list): Landmark indices to extract
+
+        Returns:
+            numpy.ndarray: float32 array of (x, y) pixel coordinates
+        """
+        pts = np.fromiter(
+            (c for p in (lm[i] for i in indices) for c in (p.x, p.y)),
+            np.float32,
+            count=2 * len(indices),
+        ).reshape(-1, 2)
+        pts *= self._lm_scale
+        return pts
+
+    def _eyelid_center(self, lm, indices):
+        """
+        Mean position of an eyelid landmark ring, in pixels.
+
+        Args:
+            lm: MediaPipe landmark list
+            indices (list): Landmark indices forming the eyelid ring
+
+        Returns:
+            tuple: (x, y) center in pixel coordinates
+        """
+        cx, cy = self._gather_px(lm, indices).mean(axis=0)
+        return int(cx), int(cy)
+
     def get_eye_location(self, debug_display=True):
         """
         Get the current eye location from camera frame using confidence-based eye selection.
@@ -227,24 +523,57 @@ class EyeDetectionModel:
         Returns:
             tuple: (x, y) coordinates of highest confidence eye center, or (None, None) if no eye detected
         """
+        self._fresh_frame = False
+
         if self.cap is None or not self.cap.isOpened():
+            self._last_landmarks = None
             return None, None
 
-        ok, frame = self.cap.read()
-        if not ok or frame is None:
+        frame = self._read_frame()
+        if frame is None:
+            self._last_landmarks = None
             return None, None
 
         # Rotate frame by 180 degrees
         frame = cv2.rotate(frame, cv2.ROTATE_180)
 
-        # Store frame for display
-        self.last_frame = frame.copy()
+        # Store frame for display - no copy needed, cv2.rotate returned a
+        # fresh array that nothing else writes to
+        self.last_frame = frame
+        self._fresh_frame = True
+
+        # Optionally downsample before inference - face-mesh cost scales
+        # roughly with pixel count, and its landmarks are normalized to
+        # [0, 1], so no coordinate remapping is needed afterwards
+        k = self.detection_scale
+        if k > 1:
+            frame = cv2.resize(
+                frame,
+                (self.frame_w // k, self.frame_h // k),
+                interpolation=cv2.INTER_AREA,
+            )
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = self.face_mesh.process(rgb)
+        # Between full inferences, a cheap optical-flow step can carry the
+        # eye center forward (landmarks from the last inference stay
+        # cached for the display overlay)
+        if self.inference_interval > 1:
+            self._flow_idx += 1
+            tracked = self._flow_track(frame)
+            if tracked is not None:
+                return tracked
+
+        # Convert into the preallocated buffer - skips a per-frame malloc.
+        # The buffer is sized from the requested geometry, but cameras
+        # don't always honor that (the resolution print at init exists for
+        # a reason), so reallocate once if the delivered shape differs
+        if self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        res = self.face_mesh.process(self._rgb_buf)
 
         if res.multi_face_landmarks:
             lm = res.multi_face_landmarks[0].landmark
+            self._last_landmarks = lm
 
             # Check if it's time to reevaluate eye visibility
             current_time = time.time()
@@ -272,6 +601,8 @@ class EyeDetectionModel:
             # Final check: if neither eye is currently visible, return None
             current_eye_visible = self._is_eye_visible(lm, self.active_eye)
             if not current_eye_visible:
+                self._prev_gray = None
+                self._prev_pt = None
                 return None, None
 
             # Get coordinates from active eye based on tracking mode
@@ -291,17 +622,15 @@ class EyeDetectionModel:
                 else:
                     eyelid_indices = self.RIGHT_EYELID
 
-                # Calculate average position of all eyelid landmarks
-                sum_x = sum(lm[i].x for i in eyelid_indices)
-                sum_y = sum(lm[i].y for i in eyelid_indices)
-                avg_x = sum_x / len(eyelid_indices)
-                avg_y = sum_y / len(eyelid_indices)
-
-                ex = int(avg_x * self.frame_w)
-                ey = int(avg_y * self.frame_h)
+                ex, ey = self._eyelid_center(lm, eyelid_indices)
 
+            if self.inference_interval > 1:
+                self._seed_flow(frame, ex, ey)
             return ex, ey
 
+        self._last_landmarks = None  # No face this frame
+        self._prev_gray = None
+        self._prev_pt = None
         return None, None
 
     def get_current_frame(self):
@@ -313,6 +642,30 @@ class EyeDetectionModel:
         """
         return self.last_frame.copy() if self.last_frame is not None else None
 
+    def process_one(self, debug_display=False):
+        """
+        Grab one frame and detect the eye center in a single step.
+
+        Unlike pairing get_eye_location with get_current_frame, this hands
+        back the captured frame itself with no copy - the coordinates were
+        computed on exactly this frame, and the next grab lands in a fresh
+        buffer, so the caller owns the returned array.
+
+        Args:
+            debug_display (bool): Whether to show debug visualization
+
+        Returns:
+            tuple: (frame, eye_x, eye_y) - frame is None if the grab failed,
+                coordinates are None if no eye was detected
+        """
+        eye_x, eye_y = self.get_eye_location(debug_display=debug_display)
+        if not self._fresh_frame:
+            # Failed/timed-out grab: last_frame still points at the frame
+            # handed out on a previous call, which the caller may have
+            # published already - never offer it for drawing again
+            return None, eye_x, eye_y
+        return self.last_frame, eye_x, eye_y
+
     def display_frame_with_packet(self, packet_info, eye_x=None, eye_y=None):
         """
         Display the last captured frame with packet information overlay.
@@ -322,16 +675,24 @@ class EyeDetectionModel:
             eye_x (int): Optional eye x coordinate for deadzone calculation
             eye_y (int): Optional eye y coordinate for deadzone calculation
         """
-        if self.last_frame is not None:
-            display_frame = self.last_frame.copy()
-
-            # Re-process the frame to get landmarks for visualization
-            rgb = cv2.cvtColor(self.last_frame, cv2.COLOR_BGR2RGB)
-            res = self.face_mesh.process(rgb)
-
-            if res.multi_face_landmarks:
-                lm = res.multi_face_landmarks[0].landmark
+        if not self.display_enabled:
+            return  # Headless - skip overlay composition and the GUI pump
 
+        if self.last_frame is not None:
+            # Compose into the reusable scratch buffer - np.copyto writes
+            # over the previous overlay instead of allocating a fresh copy
+            buf = self._display_buf
+            if buf is None or buf.shape != self.last_frame.shape:
+                self._display_buf = buf = np.empty_like(self.last_frame)
+            np.copyto(buf, self.last_frame)
+            display_frame = buf
+
+            # Landmarks cached by the get_eye_location call that produced
+            # this frame - re-running FaceMesh here would double the
+            # inference cost of every displayed frame
+            lm = self._last_landmarks
+
+            if lm is not None:
                 # Get coordinates and visualization based on tracking mode
                 if self.center_mode == "iris":
                     # Iris mode visualization
@@ -347,13 +708,17 @@ class EyeDetectionModel:
                     ex = int(iris_center.x * self.frame_w)
                     ey = int(iris_center.y * self.frame_h)
 
-                    # Draw iris contour
-                    for i in iris_indices:
-                        px = int(lm[i].x * self.frame_w)
-                        py = int(lm[i].y * self.frame_h)
-                        cv2.circle(
-                            display_frame, (px, py), 2, (0, 255, 0), -1
-                        )  # Green iris contour
+                    # Draw iris contour in one batched call - the last
+                    # index is the iris center, which gets its own circle
+                    # below, so only the ring points go to polylines
+                    ring = (
+                        self._gather_px(lm, iris_indices[:-1])
+                        .astype(np.int32)
+                        .reshape(-1, 1, 2)
+                    )
+                    cv2.polylines(
+                        display_frame, [ring], True, (0, 255, 0), 2
+                    )  # Green iris contour
                 else:
                     # Eyelid mode visualization
                     if self.active_eye == "left":
@@ -363,64 +728,56 @@ class EyeDetectionModel:
                         eyelid_indices = self.RIGHT_EYELID
                         center_color = (255, 0, 0)  # Blue for right
 
-                    # Calculate eyelid center
-                    sum_x = sum(lm[i].x for i in eyelid_indices)
-                    sum_y = sum(lm[i].y for i in eyelid_indices)
-                    avg_x = sum_x / len(eyelid_indices)
-                    avg_y = sum_y / len(eyelid_indices)
-
-                    ex = int(avg_x * self.frame_w)
-                    ey = int(avg_y * self.frame_h)
+                    # One gather serves both the center mean and the point
+                    # drawing - no second pass over the landmark attributes
+                    pts = self._gather_px(lm, eyelid_indices)
+                    cx, cy = pts.mean(axis=0)
+                    ex, ey = int(cx), int(cy)
 
-                    # Draw eyelid landmarks
-                    for i in eyelid_indices:
-                        px = int(lm[i].x * self.frame_w)
-                        py = int(lm[i].y * self.frame_h)
-                        cv2.circle(
-                            display_frame, (px, py), 1, (0, 255, 255), -1
-                        )  # Yellow eyelid points
+                    # Draw the eyelid ring as one closed polyline instead
+                    # of 16 separate circle calls - the indices are
+                    # already in contour order
+                    ring = pts.astype(np.int32).reshape(-1, 1, 2)
+                    cv2.polylines(
+                        display_frame, [ring], True, (0, 255, 255), 1
+                    )  # Yellow eyelid outline
 
                 # Draw eye center
                 cv2.circle(display_frame, (ex, ey), 5, center_color, -1)
 
-                # Add tracking mode and active eye indicator text
+                # Add tracking mode and active eye indicator text - same
+                # string every frame until the mode or eye flips, so it
+                # comes from the stamp cache
                 mode_text = (
                     f"Mode: {self.center_mode.upper()} | Eye: {self.active_eye.upper()}"
                 )
-                cv2.putText(
-                    display_frame,
-                    mode_text,
-                    (10, self.frame_h - 20),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    center_color,
-                    2,
+                self._blit_text(
+                    display_frame, mode_text, (10, self.frame_h - 20), 0.6, center_color
                 )
 
             # Draw deadzone circle at reference point
-            reference_x = self.frame_w // 2
-            reference_y = self.frame_h // 2 - self.reference_offset_pixels
             cv2.circle(
-                display_frame, (reference_x, reference_y), 5, (128, 128, 128), 1
+                display_frame, (self._ref_x, self._ref_y), 5, (128, 128, 128), 1
             )  # Gray circle
 
             # Determine packet text color based on deadzone
             text_color = (255, 255, 255)  # Default white
             if eye_x is not None and eye_y is not None:
-                # Calculate distance from reference point
-                distance = (
-                    (eye_x - reference_x) ** 2 + (eye_y - reference_y) ** 2
-                ) ** 0.5
+                # Squared-distance check against the cached radius - no sqrt
+                dx = eye_x - self._ref_x
+                dy = eye_y - self._ref_y
 
                 # If within deadzone, use green text
-                if distance <= self.deadzone_pixels:
+                if dx * dx + dy * dy <= self._dz_sq:
                     text_color = (0, 255, 0)  # Green
 
-            # Add packet info text with appropriate color
+            # "Packet: " prefix comes from a cached stamp; only the
+            # changing packet value is rasterized fresh each frame
+            x = 10 + self._blit_text(display_frame, "Packet: ", (10, 30), 1, text_color)
             cv2.putText(
                 display_frame,
-                f"Packet: {packet_info}",
-                (10, 30),
+                str(packet_info),
+                (x, 30),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 1,
                 text_color,
@@ -451,7 +808,17 @@ class EyeDetectionModel:
         except Exception as e:
             print(f"⚠️  Error closing MediaPipe face mesh: {e}")
 
-        # Step 2: Release camera with multiple attempts
+        # Step 2: Stop the capture thread before releasing the camera so
+        # cap.read() isn't mid-call when the handle goes away
+        try:
+            if getattr(self, "_capture_thread", None) is not None:
+                self._capture_stop.set()
+                self._capture_thread.join(timeout=1.0)
+                print("✓ Capture thread stopped")
+        except Exception as e:
+            print(f"⚠️  Error stopping capture thread: {e}")
+
+        # Step 3: Release camera with multiple attempts
         camera_released = False
         for attempt in range(3):
             try:
@@ -469,7 +836,7 @@ class EyeDetectionModel:
         if not camera_released:
             print("⚠️  Warning: Camera may not have been fully released")
 
-        # Step 3: Destroy OpenCV windows with forced cleanup
+        # Step 4: Destroy OpenCV windows with forced cleanup
         try:
             cv2.destroyAllWindows()
             # Multiple waitKey calls to ensure proper cleanup
@@ -479,7 +846,7 @@ class EyeDetectionModel:
         except Exception as e:
             print(f"⚠️  Error destroying OpenCV windows: {e}")
 
-        # Step 4: Force garbage collection
+        # Step 5: Force garbage collection
         try:
             import gc
 
@@ -17,6 +17,15 @@
 # Endpoints:
 #   http://[laptop-ip]:8081/stream.mjpeg  - Camera stream for iOS
 #   http://[laptop-ip]:8081/status        - Server status
+#
+# Concurrency model:
+#   The main thread runs capture + MediaPipe inference; blocking I/O is
+#   delegated to dedicated threads (serial writer, WiFi status executor,
+#   threaded HTTP server), so no network or USB stall can block tracking.
+#   Threads were chosen over an asyncio event loop deliberately: pyserial,
+#   requests, and OpenCV are all synchronous APIs, and wrapping them in
+#   executors from an event loop would reintroduce the same threads with
+#   extra indirection.
 
 import warnings
 
@@ -24,6 +33,9 @@ warnings.filterwarnings("ignore", category=UserWarning, module="google.protobuf"
 
 import serial
 import serial.tools.list_ports
+import functools
+import os
+import re
 import time
 import sys
 import threading
@@ -31,41 +43,135 @@ import atexit
 import signal
 import requests
 import socket
+import errno
+import json
+import struct
 import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 from eye_detection_model import EyeDetectionModel
 
+# Optional: simplejpeg wraps libjpeg-turbo's SIMD DCT/Huffman kernels and
+# encodes noticeably faster than cv2.imencode at the same quality. The
+# server works fine without it - encoding just falls back to OpenCV.
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 # Global configuration
 REFERENCE_OFFSET_PIXELS = 220  # Pixels above center for target reference point
 SERVER_PORT = 8081  # HTTP server port for iOS app
 CAMERA_INDEX = 1  # External camera
 FRAME_WIDTH = 640
 FRAME_HEIGHT = 480
+JPEG_QUALITY = 70  # Overlay/status stream - 70 is visually fine at 640x480
+                   # and produces materially fewer Huffman bits than 85
+
+# Encode params built once at import. 4:2:0 chroma subsampling halves the
+# chroma bytes through the encoder; the constant only exists on newer
+# OpenCV builds, hence the guard. Baseline (non-progressive, unoptimized)
+# Huffman keeps the encoder on its cheapest path.
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
+if hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+    _JPEG_PARAMS += [
+        cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+        cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+    ]
+
+# Multipart header template: everything but the payload length is constant,
+# so each frame's header is one bytes-formatting operation
+_MJPEG_PART_HEADER = (
+    b"--jpgboundary\r\n"
+    b"Content-Type: image/jpeg\r\n"
+    b"Content-Length: %d\r\n\r\n"
+)
+
+
+def _encode_jpeg(frame):
+    """
+    Encode a BGR frame to JPEG bytes.
 
+    Uses simplejpeg (libjpeg-turbo) when installed, otherwise cv2.imencode.
 
+    Args:
+        frame: BGR image array
+
+    Returns:
+        bytes: JPEG data, or None if encoding failed
+    """
+    if simplejpeg is not None:
+        h, w = frame.shape[:2]
+        # encode_jpeg_yuv_planes only exists in newer simplejpeg releases -
+        # an older install must fall through, not raise AttributeError
+        if h % 2 == 0 and w % 2 == 0 and hasattr(simplejpeg, "encode_jpeg_yuv_planes"):
+            # One BGR->I420 pass up front lets libjpeg-turbo skip its own
+            # color conversion and work from already-subsampled chroma.
+            # (MediaPipe still needs RGB separately - that conversion lives
+            # in the eye model with its own reused buffer.)
+            i420 = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+            quarter = (h // 2) * (w // 2)
+            chroma = i420[h:].reshape(-1)
+            return simplejpeg.encode_jpeg_yuv_planes(
+                np.ascontiguousarray(i420[:h]),
+                np.ascontiguousarray(chroma[:quarter].reshape(h // 2, w // 2)),
+                np.ascontiguousarray(chroma[quarter:].reshape(h // 2, w // 2)),
+                quality=JPEG_QUALITY,
+                fastdct=True,
+            )
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame),
+            quality=JPEG_QUALITY,
+            colorspace="BGR",
+            fastdct=True,
+        )
+    ret, buffer = cv2.imencode(".jpg", frame, _JPEG_PARAMS)
+    return buffer.tobytes() if ret else None
+
+# Common Arduino port/driver identifiers, compiled once so port scanning
+# is a single C-level regex search per port
+_ARDUINO_PORT_RE = re.compile(r"usbmodem|arduino|ch34[01]|ftdi", re.IGNORECASE)
+
+# Pre-encoded packet pieces: direction bytes indexed by (delta > 0) plus
+# zero-padded magnitudes, so per-frame packet assembly needs no string
+# formatting and no str.encode before the serial write
+_PAD3 = tuple(f"{i:03d}".encode() for i in range(1000))
+_VDIR = (b"U", b"D")
+_HDIR = (b"L", b"R")
+_IN_ZONE = b"U000L000"  # Eye detected and inside the deadzone
+_NEUTRAL = b"N000N000"  # No eye detected
+
+# Optional compact binary protocol: sync byte, flag byte, |dy|, |dx| as
+# little-endian uint16 - 6 bytes instead of 8 ASCII and no digit encoding.
+# Requires matching Arduino firmware, so the ASCII format stays the default.
+_BIN_PACKER = struct.Struct("<BBHH")
+_BIN_SYNC = 0xA5
+_BIN_FLAG_RIGHT = 0x01  # dx > 0 (otherwise left)
+_BIN_FLAG_DOWN = 0x02  # dy > 0 (otherwise up)
+_BIN_FLAG_NO_EYE = 0x04  # No eye detected; magnitudes are zero
+_BIN_IN_ZONE = _BIN_PACKER.pack(_BIN_SYNC, 0, 0, 0)
+_BIN_NO_EYE = _BIN_PACKER.pack(_BIN_SYNC, _BIN_FLAG_NO_EYE, 0, 0)
+
+
+@functools.lru_cache(maxsize=1)
 def find_arduino_port():
     """
     Automatically detect Arduino serial port.
 
+    Memoized: enumerating the USB tree via comports() can take 50-100 ms,
+    so the result is cached for the process lifetime. Reconnect paths call
+    cache_clear() first when the cached port stops working.
+
     Returns:
         str: Arduino port path, or None if not found
     """
     ports = serial.tools.list_ports.comports()
 
-    # Look for common Arduino identifiers
+    # Look for common Arduino identifiers in the device name or description
     for port in ports:
-        port_name = port.device.lower()
-        description = (port.description or "").lower()
-
-        # Check for Arduino-like ports
-        if (
-            "usbmodem" in port_name
-            or "arduino" in description
-            or "ch340" in description
-            or "ch341" in description
-            or "ftdi" in description
-        ):
+        if _ARDUINO_PORT_RE.search(f"{port.device} {port.description or ''}"):
             print(
                 f"🔍 Found potential Arduino port: {port.device} ({port.description})"
             )
@@ -75,6 +181,15 @@ def find_arduino_port():
     return None
 
 
+# Shared HTTP session: status probes reuse one kept-alive TCP connection
+# instead of paying a connect/teardown round trip on every poll. A single
+# pooled connection is plenty for one Arduino.
+_HTTP = requests.Session()
+_HTTP.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+)
+
+
 def check_arduino_wifi_status(arduino_ip="192.168.1.60", port=8080, timeout=2):
     """
     Check if Arduino WiFi server is accessible and get plotter status.
@@ -88,7 +203,7 @@ def check_arduino_wifi_status(arduino_ip="192.168.1.60", port=8080, timeout=2):
         dict: Status response or None if not accessible
     """
     try:
-        response = requests.get(f"http://{arduino_ip}:{port}/status", timeout=timeout)
+        response = _HTTP.get(f"http://{arduino_ip}:{port}/status", timeout=timeout)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -96,8 +211,10 @@ def check_arduino_wifi_status(arduino_ip="192.168.1.60", port=8080, timeout=2):
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get the local IP address of this machine."""
+    """Get the local IP address of this machine (cached - opening a UDP
+    socket per request is a wasted syscall round trip)."""
     try:
         # Connect to a remote address to determine local IP
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -112,6 +229,10 @@ def get_local_ip():
 class CameraStreamHandler(BaseHTTPRequestHandler):
     """HTTP request handler for camera streaming."""
 
+    # MJPEG parts are small; without this Nagle batches them and adds up to
+    # ~200 ms of latency per boundary write on Wi-Fi clients
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         """Handle GET requests for camera stream."""
         if self.path == "/stream.mjpeg":
@@ -138,21 +259,17 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         ):
             frame = self.server.unified_controller.get_latest_annotated_frame()
             if frame is not None:
-                ret, buffer = cv2.imencode(
-                    ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85]
-                )
-                if ret:
-                    self.wfile.write(buffer.tobytes())
+                jpg = _encode_jpeg(frame)
+                if jpg is not None:
+                    self.wfile.write(jpg)
                     return
 
         # Send a simple test pattern if no camera
-        import numpy as np
-
         test_image = np.zeros((240, 320, 3), dtype=np.uint8)
         test_image[60:180, 80:240] = [0, 255, 0]  # Green rectangle
-        ret, buffer = cv2.imencode(".jpg", test_image)
-        if ret:
-            self.wfile.write(buffer.tobytes())
+        jpg = _encode_jpeg(test_image)
+        if jpg is not None:
+            self.wfile.write(jpg)
 
     def send_mjpeg_stream(self):
         """Send MJPEG camera stream."""
@@ -166,40 +283,46 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
         try:
+            last_seq = 0
+            dropped = 0
             while True:
-                if (
-                    hasattr(self.server, "unified_controller")
-                    and self.server.unified_controller
-                ):
-                    frame = self.server.unified_controller.get_latest_annotated_frame()
-                    if frame is not None:
-                        # Encode frame as JPEG
-                        ret, buffer = cv2.imencode(
-                            ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85]
-                        )
-                        if ret:
-                            try:
-                                self.wfile.write(b"--jpgboundary\r\n")
-                                self.wfile.write(
-                                    f"Content-Type: image/jpeg\r\n".encode()
-                                )
-                                self.wfile.write(
-                                    f"Content-Length: {len(buffer)}\r\n\r\n".encode()
-                                )
-                                self.wfile.write(buffer.tobytes())
-                                self.wfile.write(b"\r\n")
-                                self.wfile.flush()
-                            except (BrokenPipeError, ConnectionResetError):
-                                # Client disconnected - exit gracefully
-                                break
-
-                time.sleep(1 / 15)  # 15 FPS for better compatibility
+                controller = getattr(self.server, "unified_controller", None)
+                if controller is None:
+                    time.sleep(0.1)
+                    continue
+
+                # Block until the tracking loop publishes a new frame - no
+                # sleep-polling, no per-client encode. A client stalled in
+                # write() resumes at the newest frame; skipped frames are
+                # never queued behind it (drop-oldest, single-slot buffer).
+                prev_seq = last_seq
+                jpg, last_seq = controller.wait_for_jpeg(last_seq)
+                if not controller.running:
+                    break
+                if jpg is None:
+                    continue
+                if prev_seq and last_seq - prev_seq > 1:
+                    # Seq gap = frames we skipped while this client was busy
+                    # writing. Counted (not queued) so latency stays bounded.
+                    dropped += last_seq - prev_seq - 1
+
+                try:
+                    # One write per frame instead of five: header, payload,
+                    # and trailer leave as a single contiguous chunk
+                    self.wfile.write(_MJPEG_PART_HEADER % len(jpg) + jpg + b"\r\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client disconnected - exit gracefully
+                    break
 
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
             # Normal disconnection - don't log as error
             pass
         except Exception as e:
             print(f"Stream error: {e}")
+        finally:
+            if dropped:
+                print(f"📉 Stream client skipped {dropped} frames (slow consumer)")
 
     def send_status(self):
         """Send server status as JSON."""
@@ -226,16 +349,22 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
             "stream_url": f"http://{get_local_ip()}:{SERVER_PORT}/stream.mjpeg",
         }
 
-        import json
-
         self.wfile.write(json.dumps(status).encode())
 
+    # Viewer page rendered to bytes on first request and reused after -
+    # the content only depends on the (cached) local IP and server port
+    _html_page = None
+
     def send_html_viewer(self):
         """Send a simple HTML viewer for testing."""
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
         self.end_headers()
 
+        if CameraStreamHandler._html_page is not None:
+            self.wfile.write(CameraStreamHandler._html_page)
+            return
+
         html = f"""
         <!DOCTYPE html>
         <html>
@@ -258,7 +387,8 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
         </body>
         </html>
         """
-        self.wfile.write(html.encode())
+        CameraStreamHandler._html_page = html.encode()
+        self.wfile.write(CameraStreamHandler._html_page)
 
     def log_message(self, format, *args):
         """Override to reduce HTTP request logging."""
@@ -266,16 +396,22 @@ class CameraStreamHandler(BaseHTTPRequestHandler):
 
 
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
-    """Threading HTTP server for handling multiple connections."""
+    """
+    Threading HTTP server for handling multiple connections.
+
+    Thread-per-client is deliberate (see the concurrency note at the top
+    of this file): handlers spend their time blocked on the frame
+    Condition or in socket sends with the GIL released, frames arrive
+    pre-encoded, and the client count is a handful of iOS devices. An
+    asyncio fanout would add a thread bridge from the tracking loop for
+    no measurable win at this scale.
+    """
 
     allow_reuse_address = True
     daemon_threads = True
 
     def handle_error(self, request, client_address):
         """Handle network errors gracefully without crashing."""
-        import sys
-        import errno
-
         # Get the actual exception info
         exc_type, exc_value, exc_traceback = sys.exc_info()
 
@@ -307,6 +443,10 @@ class UnifiedEyeTrackingController:
         deadzone_pixels=10,
         arduino_ip="192.168.1.60",
         arduino_port=8080,
+        write_coalesce_delay=0.004,
+        detection_scale=2,
+        binary_protocol=False,
+        target_fps=30,
     ):
         """
         Initialize unified eye tracking controller.
@@ -317,6 +457,16 @@ class UnifiedEyeTrackingController:
             deadzone_pixels (int): Deadzone radius in pixels around frame center
             arduino_ip (str): Arduino WiFi IP address
             arduino_port (int): Arduino WiFi server port
+            detection_scale (int): Downsample factor for face-mesh inference
+                (2 halves each dimension, ~4x fewer pixels to process)
+            binary_protocol (bool): Send the compact 6-byte binary packets
+                instead of 8-byte ASCII. Only enable with firmware built to
+                parse the binary format.
+            write_coalesce_delay (float): Seconds the serial writer waits
+                after waking so back-to-back packets collapse into one write
+                (0 disables coalescing)
+            target_fps (int): Fixed-step rate for the main loop; caps CPU
+                and serial traffic at a predictable ceiling
         """
         print(f"🚀 Initializing Unified Eye Tracking System...")
         print("=" * 50)
@@ -324,6 +474,8 @@ class UnifiedEyeTrackingController:
         self.serial_port = serial_port
         self.baud_rate = baud_rate
         self.deadzone_pixels = deadzone_pixels
+        self.binary_protocol = binary_protocol
+        self.target_fps = target_fps
         self.arduino = None
 
         # WiFi communication setup
@@ -334,13 +486,24 @@ class UnifiedEyeTrackingController:
 
         # Camera streaming
         self.latest_annotated_frame = None
-        self.frame_lock = threading.Lock()
+        self.latest_jpeg = None
+        # Condition doubles as the frame lock; frame_seq lets stream
+        # handlers wait for exactly the next published frame instead of
+        # sleep-polling and re-encoding per client
+        self.frame_cond = threading.Condition()
+        self.frame_seq = 0
+        self.running = True
 
         # Arduino serial setup
+        self._arduino_fd = None
         if serial_port:
             print(f"🔌 Serial port: {serial_port}, baud rate: {baud_rate}")
             try:
-                self.arduino = serial.Serial(serial_port, baud_rate, timeout=1)
+                self.arduino = serial.Serial(
+                    serial_port, baud_rate, timeout=0.01, write_timeout=0.05
+                )
+                self._enable_low_latency(self.arduino)
+                self._arduino_fd = self._port_fd(self.arduino)
                 print("✅ Arduino serial connection established")
                 time.sleep(2)  # Allow board reset
             except Exception as e:
@@ -370,6 +533,10 @@ class UnifiedEyeTrackingController:
                 camera_index=CAMERA_INDEX,
                 deadzone_pixels=self.deadzone_pixels,
                 reference_offset_pixels=REFERENCE_OFFSET_PIXELS,
+                detection_scale=detection_scale,
+                # Pipeline stage 1: the model's reader thread overlaps
+                # cap.read() with FaceMesh inference in the eye producer
+                threaded_capture=True,
             )
             print("✅ Eye detection model initialized")
         except Exception as e:
@@ -381,6 +548,78 @@ class UnifiedEyeTrackingController:
         self.frame_h = self.eye_model.frame_h
         print(f"📹 Camera resolution: {self.frame_w}x{self.frame_h}")
 
+        # Precompute the reference point - invariant arithmetic that was
+        # being redone on every frame
+        self._ref_x = self.frame_w >> 1
+        self._ref_y = (self.frame_h >> 1) - REFERENCE_OFFSET_PIXELS
+
+        # Static overlay rasterized once: reference dot, deadzone ring, and
+        # the stream-active caption never change, so per-frame annotation
+        # is a masked blit plus the genuinely dynamic text lines
+        self._static_overlay = np.zeros((self.frame_h, self.frame_w, 3), np.uint8)
+        self._static_mask = np.zeros((self.frame_h, self.frame_w), np.uint8)
+        for img, circle_color, text_color in (
+            (self._static_overlay, (255, 0, 0), (255, 255, 255)),
+            (self._static_mask, 255, 255),
+        ):
+            cv2.circle(img, (self._ref_x, self._ref_y), 3, circle_color, -1)
+            cv2.circle(
+                img, (self._ref_x, self._ref_y), self.deadzone_pixels, circle_color, 2
+            )
+            cv2.putText(
+                img,
+                "iOS Stream: Active",
+                (10, 85),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                text_color,
+                1,
+            )
+
+        # Pre-encoded half-packet tables indexed by signed delta (offset by
+        # the frame dimension): building a packet is two lookups and one
+        # concatenation, with direction select, abs, and digit formatting
+        # all paid once here
+        self._deadzone_sq = deadzone_pixels * deadzone_pixels
+        self._v_off = self.frame_h
+        self._v_max = 2 * self.frame_h
+        self._v_half = tuple(
+            _VDIR[d > 0] + _PAD3[min(abs(d), 999)]
+            for d in range(-self.frame_h, self.frame_h + 1)
+        )
+        self._h_off = self.frame_w
+        self._h_max = 2 * self.frame_w
+        self._h_half = tuple(
+            _HDIR[d > 0] + _PAD3[min(abs(d), 999)]
+            for d in range(-self.frame_w, self.frame_w + 1)
+        )
+
+        # WiFi status probes run on a single-worker executor so a slow or
+        # flaky Arduino can never stall the tracking loop for the HTTP
+        # timeout; the loop only reads the cached plotter_enabled flag
+        self._status_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wifi-status"
+        )
+        self._status_future = None
+
+        # Background serial writer: the tracking loop publishes the newest
+        # packet into a single slot and never blocks on a USB write; stale
+        # packets are simply overwritten (newest-wins coalescing)
+        self._tx_slot = [None]
+        self._tx_event = threading.Event()
+        self._tx_stop = False
+        self.write_coalesce_delay = write_coalesce_delay
+        self._tx_thread = threading.Thread(target=self._serial_writer_loop, daemon=True)
+        self._tx_thread.start()
+
+        # Duplicate-packet suppression: fixations produce identical packets
+        # for many consecutive frames, so those writes are skipped; a forced
+        # resend once per second keeps the Arduino from sitting on stale
+        # state if a packet was lost
+        self._last_packet = None
+        self._next_keepalive_ns = 0
+        self._keepalive_interval_ns = 1_000_000_000  # 1 s between forced resends
+
         # Cleanup tracking
         self._cleanup_called = False
         self._cleanup_lock = threading.Lock()
@@ -395,6 +634,22 @@ class UnifiedEyeTrackingController:
             f"🌐 HTTP camera server will be available at: http://{get_local_ip()}:{SERVER_PORT}"
         )
 
+    @staticmethod
+    def _enable_low_latency(port):
+        """Ask the driver to shrink its USB latency timer (no-op if unsupported)."""
+        try:
+            port.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass  # Not supported on this platform/driver
+
+    @staticmethod
+    def _port_fd(port):
+        """Return the port's OS file descriptor, or None where unavailable."""
+        try:
+            return port.fileno()
+        except (AttributeError, NotImplementedError, OSError):
+            return None  # e.g. Windows - fall back to pyserial writes
+
     def _calculate_directional_packet(self, eye_x, eye_y):
         """
         Calculate directional packet from eye coordinates.
@@ -404,44 +659,122 @@ class UnifiedEyeTrackingController:
             eye_y (int): Eye y coordinate
 
         Returns:
-            str: 8-character directional packet
+            bytes: 8-byte directional packet
         """
-        # Reference point is REFERENCE_OFFSET_PIXELS above center (after 180-degree rotation)
-        reference_x = self.frame_w // 2
-        reference_y = self.frame_h // 2 - REFERENCE_OFFSET_PIXELS
-
-        # Compute deltas relative to reference point
-        dx = eye_x - reference_x  # + = right,  - = left
-        dy = eye_y - reference_y  # + = down,   - = up
+        # Kept as pure Python on purpose: with the precomputed half-packet
+        # tables this is two subtractions, one compare, and two indexed
+        # lookups per call - a Cython/Numba kernel would save well under a
+        # microsecond per frame and add a build step for no measurable gain
+        # Reference point is REFERENCE_OFFSET_PIXELS above center (after
+        # 180-degree rotation), precomputed once in __init__
+        dx = eye_x - self._ref_x  # + = right,  - = left
+        dy = eye_y - self._ref_y  # + = down,   - = up
+
+        # Check if within deadzone (squared distances - no sqrt)
+        if dx * dx + dy * dy <= self._deadzone_sq:
+            return _IN_ZONE  # Eye detected and in target zone
+
+        # Table indexes, clamped in case a landmark lands slightly outside
+        # the frame bounds
+        vi = dy + self._v_off
+        if vi < 0:
+            vi = 0
+        elif vi > self._v_max:
+            vi = self._v_max
+        hi = dx + self._h_off
+        if hi < 0:
+            hi = 0
+        elif hi > self._h_max:
+            hi = self._h_max
+
+        # One 8-byte allocation per call (the concatenation). A mutate-in-
+        # place bytearray would not do better: the writer thread and the
+        # duplicate-suppression compare both need an immutable snapshot, so
+        # a bytes() copy of the same size would be paid anyway
+        return self._v_half[vi] + self._h_half[hi]
+
+    def _calculate_binary_packet(self, eye_x, eye_y):
+        """
+        Calculate the compact binary packet from eye coordinates.
 
-        # Check if within deadzone
-        distance = (dx**2 + dy**2) ** 0.5
-        if distance <= self.deadzone_pixels:
-            return "U000L000"  # Eye detected and in target zone
+        Args:
+            eye_x (int): Eye x coordinate
+            eye_y (int): Eye y coordinate
 
-        dir_v = "U" if dy <= 0 else "D"
-        dir_h = "L" if dx <= 0 else "R"
+        Returns:
+            bytes: 6-byte binary packet (sync, flags, |dy|, |dx|)
+        """
+        dx = eye_x - self._ref_x
+        dy = eye_y - self._ref_y
 
-        dist_v = abs(dy)  # vertical magnitude
-        dist_h = abs(dx)  # horizontal magnitude
+        if dx * dx + dy * dy <= self._deadzone_sq:
+            return _BIN_IN_ZONE
 
-        return f"{dir_v}{dist_v:03d}{dir_h}{dist_h:03d}"
+        flags = ((dy > 0) << 1) | (dx > 0)
+        return _BIN_PACKER.pack(_BIN_SYNC, flags, abs(dy), abs(dx))
 
     def send_packet_to_arduino(self, packet):
         """
-        Send packet to Arduino via serial.
+        Publish packet for the background serial writer thread.
+
+        Overwrites any packet still waiting in the slot - for eye tracking
+        only the newest position matters, so stale packets are dropped.
+        Packets identical to the last one sent are skipped until the
+        keepalive deadline passes.
 
         Args:
-            packet (str): 8-character packet to send
+            packet (bytes): 8-byte packet to send
+        """
+        now_ns = time.monotonic_ns()
+        if packet == self._last_packet and now_ns < self._next_keepalive_ns:
+            return
+        self._last_packet = packet
+        self._next_keepalive_ns = now_ns + self._keepalive_interval_ns
+        self._tx_slot[0] = packet
+        self._tx_event.set()
+
+    def _serial_writer_loop(self):
+        """Background thread that writes the newest published packet to serial."""
+        while not self._tx_stop:
+            self._tx_event.wait()
+            # Brief forwarding delay (on the order of the 1 kHz USB
+            # microframe clock): packets arriving in this window overwrite
+            # the slot and the burst goes out as a single newest-only write
+            if self.write_coalesce_delay and not self._tx_stop:
+                time.sleep(self.write_coalesce_delay)
+            self._tx_event.clear()
+            packet = self._tx_slot[0]
+            if packet is not None and not self._tx_stop:
+                self._write_packet(packet)
+
+    def _write_packet(self, packet):
+        """
+        Write packet to Arduino via serial, reconnecting on failure.
+
+        Args:
+            packet (bytes): 8-byte packet to send
         """
         # Send via serial if available
         if self.arduino is not None:
             try:
-                if not self.arduino.is_open:
-                    print("⚠️  Arduino connection closed - attempting to reconnect...")
-                    self.arduino.open()
-                self.arduino.write(packet.encode())
-                self.arduino.flush()  # Ensure packet is sent immediately
+                # No flush() here: flush blocks until the kernel drains the
+                # tty buffer, costing up to milliseconds per packet. The OS
+                # pushes the bytes at the next USB microframe regardless, and
+                # write_timeout already bounds pathological backpressure.
+                # cleanup() still flushes once so the final packet lands.
+                if self._arduino_fd is not None:
+                    # Raw fd write skips pyserial's per-call copy, timeout
+                    # bookkeeping, and select(); an 8-byte write to a tty
+                    # either completes or raises, and errors land in the
+                    # same reconnect handler below
+                    os.write(self._arduino_fd, packet)
+                else:
+                    if not self.arduino.is_open:
+                        print(
+                            "⚠️  Arduino connection closed - attempting to reconnect..."
+                        )
+                        self.arduino.open()
+                    self.arduino.write(packet)
             except Exception as e:
                 print(f"⚠️  Failed to send packet '{packet}' via serial: {e}")
                 # Try to reconnect
@@ -449,24 +782,55 @@ class UnifiedEyeTrackingController:
                     print("🔄 Attempting to reconnect to Arduino...")
                     if self.arduino:
                         self.arduino.close()
-                    import serial
-
                     self.arduino = serial.Serial(
-                        self.serial_port, self.baud_rate, timeout=1
+                        self.serial_port,
+                        self.baud_rate,
+                        timeout=0.01,
+                        write_timeout=0.05,
                     )
+                    self._enable_low_latency(self.arduino)
+                    self._arduino_fd = self._port_fd(self.arduino)
                     print("✅ Serial reconnection successful")
                 except Exception as reconnect_error:
                     print(f"❌ Serial reconnection failed: {reconnect_error}")
+                    # The board may have re-enumerated at a new device path;
+                    # drop the memoized scan and try the freshly found port
+                    find_arduino_port.cache_clear()
+                    new_port = find_arduino_port()
+                    if new_port is not None and new_port != self.serial_port:
+                        try:
+                            self.serial_port = new_port
+                            self.arduino = serial.Serial(
+                                new_port,
+                                self.baud_rate,
+                                timeout=0.01,
+                                write_timeout=0.05,
+                            )
+                            self._enable_low_latency(self.arduino)
+                            self._arduino_fd = self._port_fd(self.arduino)
+                            print(f"✅ Reconnected on rediscovered port {new_port}")
+                            return
+                        except Exception:
+                            pass
                     print("📺 Continuing without serial communication")
                     self.arduino = None
+                    self._arduino_fd = None
 
     def check_plotter_status(self):
-        """Check and update plotter status via WiFi."""
-        if self.wifi_enabled:
-            try:
-                status = check_arduino_wifi_status(
-                    self.arduino_ip, self.arduino_port, timeout=1
-                )
+        """
+        Refresh plotter status via WiFi without blocking the caller.
+
+        The HTTP probe runs on the status executor; this method only
+        harvests the previous probe's result and schedules the next one, so
+        a 1-second timeout on flaky WiFi never stalls the tracking loop.
+        """
+        if not self.wifi_enabled:
+            return False
+
+        updated = False
+        if self._status_future is None or self._status_future.done():
+            if self._status_future is not None:
+                status = self._status_future.result()
                 if status:
                     old_status = self.plotter_enabled
                     self.plotter_enabled = status.get("enabled", False)
@@ -474,19 +838,46 @@ class UnifiedEyeTrackingController:
                         print(
                             f"📊 Plotter status changed: {'enabled' if self.plotter_enabled else 'disabled'}"
                         )
-                    return True
-            except Exception as e:
-                pass  # Silently handle status check failures
-        return False
+                    updated = True
+            self._status_future = self._status_executor.submit(
+                check_arduino_wifi_status, self.arduino_ip, self.arduino_port, 1
+            )
+        return updated
 
     def get_latest_annotated_frame(self):
-        """Get the latest annotated camera frame for streaming."""
-        with self.frame_lock:
-            return (
-                self.latest_annotated_frame.copy()
-                if self.latest_annotated_frame is not None
-                else None
+        """
+        Get the latest annotated camera frame.
+
+        Returns the published array itself, not a copy: each annotated
+        frame is built in a fresh buffer and never touched again after
+        publication. Treat the result as read-only.
+        """
+        with self.frame_cond:
+            return self.latest_annotated_frame
+
+    def get_latest_jpeg(self):
+        """Get the latest frame pre-encoded as JPEG bytes (no copy - immutable)."""
+        with self.frame_cond:
+            return self.latest_jpeg
+
+    def wait_for_jpeg(self, last_seq, timeout=1.0):
+        """
+        Block until a frame newer than last_seq is published.
+
+        Args:
+            last_seq (int): Sequence number of the last frame the caller sent
+            timeout (float): Max seconds to wait (guards against a stalled
+                tracking loop keeping clients blocked forever)
+
+        Returns:
+            tuple: (jpeg_bytes or None, new_seq)
+        """
+        with self.frame_cond:
+            self.frame_cond.wait_for(
+                lambda: self.frame_seq != last_seq or not self.running,
+                timeout=timeout,
             )
+            return self.latest_jpeg, self.frame_seq
 
     def run(self, debug_display=True):
         """
@@ -504,43 +895,89 @@ class UnifiedEyeTrackingController:
         loop_count = 0
         last_eye_status = None
         last_status_check = 0
+        get_time = time.time  # Local binding saves a global lookup per frame
+        monotonic = time.monotonic
+        period = 1.0 / self.target_fps
+        next_tick = monotonic()
+
+        # Select the wire format once for the lifetime of the loop
+        if self.binary_protocol:
+            calculate_packet = self._calculate_binary_packet
+            neutral_packet = _BIN_NO_EYE
+        else:
+            calculate_packet = self._calculate_directional_packet
+            neutral_packet = _NEUTRAL
+
+        # Producer thread: camera grab + MediaPipe inference run here so they
+        # overlap the packet formatting, serial write, and HTTP work done on
+        # the main thread. MediaPipe releases the GIL during inference, so
+        # this is genuine overlap, not time-slicing. Only the newest (x, y)
+        # is kept - stale positions are worthless for tracking.
+        eye_slot = [(None, None)]
+        eye_lock = threading.Lock()
+        eye_fresh = threading.Event()
+        eye_stop = threading.Event()
+
+        def eye_loop():
+            get_eye = self.eye_model.get_eye_location
+            while not eye_stop.is_set():
+                try:
+                    xy = get_eye(debug_display=False)
+                except Exception as e:
+                    print(f"Error getting eye location: {e}")
+                    xy = (None, None)
+                with eye_lock:
+                    eye_slot[0] = xy
+                eye_fresh.set()
+
+        eye_thread = threading.Thread(target=eye_loop, daemon=True, name="eye-producer")
+        eye_thread.start()
+
+        # Give the producer a chance to publish its first sample before the
+        # loop starts, so the opening ticks don't send "no eye" packets
+        # while inference is still warming up. Bounded wait - a dead camera
+        # must not hang startup
+        eye_fresh.wait(timeout=2.0)
 
         try:
             while True:
                 loop_count += 1
-                current_time = time.time()
+                current_time = get_time()
 
                 # Check plotter status periodically (every 5 seconds)
                 if current_time - last_status_check > 5:
                     self.check_plotter_status()
                     last_status_check = current_time
 
-                # Get eye location from model
-                try:
-                    eye_x, eye_y = self.eye_model.get_eye_location(debug_display=False)
-                except Exception as e:
-                    print(f"Error getting eye location: {e}")
-                    eye_x, eye_y = None, None
+                # Read the newest sample published by the producer thread;
+                # pacing comes from the fixed-step scheduler below, not from
+                # waiting on the camera
+                with eye_lock:
+                    eye_x, eye_y = eye_slot[0]
 
                 # Calculate packet
                 if eye_x is not None and eye_y is not None:
                     # Calculate and send directional packet
-                    packet = self._calculate_directional_packet(eye_x, eye_y)
+                    packet = calculate_packet(eye_x, eye_y)
                     if last_eye_status != "detected":
                         last_eye_status = "detected"
                 else:
                     # No eye detected
-                    packet = "N000N000"
+                    packet = neutral_packet
                     if last_eye_status != "not_detected":
                         last_eye_status = "not_detected"
 
                 # Send packet to Arduino (both serial and WiFi are handled by Arduino)
                 self.send_packet_to_arduino(packet)
+                # For the display overlays below (binary packets shown as hex)
+                packet_str = packet.hex() if self.binary_protocol else packet.decode()
 
-                # Create annotated frame for iOS streaming
-                frame = self.eye_model.get_current_frame()
-                if frame is not None:
-                    annotated_frame = frame.copy()
+                # Create annotated frame for iOS streaming.
+                # get_current_frame already hands back a private copy, so
+                # the overlays below can be stamped straight onto it - the
+                # second copy that used to live here was pure waste
+                annotated_frame = self.eye_model.get_current_frame()
+                if annotated_frame is not None:
 
                     # Add eye tracking visualizations
                     if eye_x is not None and eye_y is not None:
@@ -552,27 +989,18 @@ class UnifiedEyeTrackingController:
                             (0, 255, 0),
                             -1,
                         )
-                        status_text = f"Eye Detected - {packet}"
+                        status_text = f"Eye Detected - {packet_str}"
                     else:
                         status_text = "No Eye Detected"
 
-                    # Add reference point and deadzone visualization
-                    ref_x = self.frame_w // 2
-                    ref_y = self.frame_h // 2 - REFERENCE_OFFSET_PIXELS
-                    cv2.circle(
-                        annotated_frame, (ref_x, ref_y), 3, (255, 0, 0), -1
-                    )  # Blue reference point
-                    cv2.circle(
-                        annotated_frame,
-                        (ref_x, ref_y),
-                        self.deadzone_pixels,
-                        (255, 0, 0),
-                        2,
-                    )  # Blue deadzone circle
-
-                    # Add comprehensive status overlay
+                    # Blit the pre-rasterized reference point, deadzone ring,
+                    # and static caption in one masked copy
+                    cv2.copyTo(self._static_overlay, self._static_mask, annotated_frame)
+
+                    # Only the genuinely dynamic status lines are rendered
+                    # per frame ("iOS Stream: Active" lives in the overlay)
                     status_lines = [
-                        f"Packet: {packet}",
+                        f"Packet: {packet_str}",
                         f"Frame: {loop_count}",
                         f"Arduino: {'Serial' if self.arduino else 'None'}"
                         + (
@@ -580,7 +1008,6 @@ class UnifiedEyeTrackingController:
                             if self.wifi_enabled
                             else ""
                         ),
-                        f"iOS Stream: Active",
                     ]
 
                     for i, line in enumerate(status_lines):
@@ -595,9 +1022,16 @@ class UnifiedEyeTrackingController:
                             1,
                         )
 
-                    # Update frame for streaming
-                    with self.frame_lock:
+                    # Encode once here so every stream client shares the
+                    # same JPEG bytes instead of re-encoding per connection
+                    jpg = _encode_jpeg(annotated_frame)
+
+                    # Publish and wake every client waiting on this frame
+                    with self.frame_cond:
                         self.latest_annotated_frame = annotated_frame
+                        self.latest_jpeg = jpg
+                        self.frame_seq += 1
+                        self.frame_cond.notify_all()
 
                 # Display frame locally if debug is enabled
                 if debug_display:
@@ -614,7 +1048,7 @@ class UnifiedEyeTrackingController:
                             status_text += " (No Arduino)"
                         status_text += " | iOS Stream: Active"
 
-                        packet_with_status = f"{packet} | {status_text}"
+                        packet_with_status = f"{packet_str} | {status_text}"
                         self.eye_model.display_frame_with_packet(
                             packet_with_status, eye_x, eye_y
                         )
@@ -622,18 +1056,34 @@ class UnifiedEyeTrackingController:
                         print(f"Error displaying camera frame: {e}")
 
                 # Check for quit command (only if debug display is enabled)
+                # pollKey returns immediately instead of blocking >=1 ms
+                # per frame like waitKey(1)
                 if debug_display:
-                    key = cv2.waitKey(1) & 0xFF
+                    key = cv2.pollKey() & 0xFF
                     if key == ord("q"):
                         print("Quit key pressed")
                         break
 
+                # Fixed-step scheduler: sleep out the remainder of this tick
+                # so the loop runs at a predictable rate instead of spinning.
+                # Catch-up-safe: a late tick resets the baseline rather than
+                # firing a burst of back-to-back frames
+                next_tick += period
+                remaining = next_tick - monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    next_tick = monotonic()
+
         except KeyboardInterrupt:
             print("\n🛑 Interrupted by user")
         except Exception as e:
             print(f"\n❌ Unexpected error in main loop: {e}")
         finally:
             print("\n📴 Shutting down...")
+            # Stop the producer before releasing the camera underneath it
+            eye_stop.set()
+            eye_thread.join(timeout=1.0)
             self.cleanup()
 
     def _signal_handler(self, signum, frame):
@@ -651,6 +1101,33 @@ class UnifiedEyeTrackingController:
 
         print("\n🧹 Starting comprehensive cleanup...")
 
+        # Release any stream handlers blocked waiting for the next frame
+        try:
+            self.running = False
+            if hasattr(self, "frame_cond"):
+                with self.frame_cond:
+                    self.frame_cond.notify_all()
+        except Exception as e:
+            print(f"⚠️  Error waking stream clients: {e}")
+
+        # Step 0: Stop the background serial writer so it can't interleave
+        # with the final neutral packet
+        try:
+            if hasattr(self, "_tx_thread") and self._tx_thread.is_alive():
+                self._tx_stop = True
+                self._tx_event.set()
+                self._tx_thread.join(timeout=0.5)
+                print("✅ Serial writer thread stopped")
+        except Exception as e:
+            print(f"⚠️  Error stopping serial writer thread: {e}")
+
+        # Stop the WiFi status executor (don't wait on an in-flight probe)
+        try:
+            if hasattr(self, "_status_executor"):
+                self._status_executor.shutdown(wait=False)
+        except Exception as e:
+            print(f"⚠️  Error stopping status executor: {e}")
+
         # Step 1: Send neutral signal to Arduino before shutdown
         try:
             if hasattr(self, "arduino") and self.arduino and self.arduino.is_open: